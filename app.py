@@ -6,23 +6,46 @@ Interactive dashboard for cross-referencing Shipvoid Forecast and Legacy Unbille
 Features live data refresh from configurable network share.
 """
 
-import json
+import asyncio
 import os
+import threading
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 import config
 import data_loader
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm templates and data before serving, then keep data fresh in the background."""
+    for template_name in ("index.html", "partials/stats.html"):
+        templates.env.get_template(template_name)
+    data = await asyncio.to_thread(get_cached_data)
+    await asyncio.to_thread(get_rows_json, data)
+    
+    refresh_task = None
+    if config.AUTO_REFRESH_MINUTES > 0:
+        refresh_task = asyncio.create_task(auto_refresh(config.AUTO_REFRESH_MINUTES * 60))
+    yield
+    if refresh_task:
+        refresh_task.cancel()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=config.APP_TITLE,
-    description=config.APP_DESCRIPTION
+    description=config.APP_DESCRIPTION,
+    lifespan=lifespan
 )
 
 # Setup templates
@@ -30,6 +53,12 @@ templates_dir = Path(__file__).parent / "templates"
 templates_dir.mkdir(exist_ok=True)
 templates = Jinja2Templates(directory=str(templates_dir))
 
+# Persist compiled templates across restarts; skip per-request mtime checks
+jinja_cache_dir = Path(config.CACHE_DIR) / "jinja"
+jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
+templates.env.auto_reload = config.TEMPLATE_AUTO_RELOAD
+
 # Static files (for team logo)
 static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
@@ -38,18 +67,46 @@ if (Path(__file__).parent / "team-logo.png").exists():
     shutil.copy(Path(__file__).parent / "team-logo.png", static_dir / "team-logo.png")
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-# Global data cache
+# Global data cache; _cache_lock serializes loads so concurrent misses parse once
 _cached_data = None
+_cache_lock = threading.Lock()
+_refresh_thread = None
+# Held only while checking for and starting a refresh thread (loads hold _cache_lock)
+_refresh_start_lock = threading.Lock()
+_last_refresh_paths = (None, None)  # (source_path, legacy_path) reused by auto refresh
+
+# Serialized table rows for the dataset they were built from: (data, json_str)
+_cached_rows_json = (None, '[]')
 
 
 def get_cached_data() -> dict:
     """Get cached data, loading if not available."""
     global _cached_data
     if _cached_data is None:
+        with _cache_lock:
+            if _cached_data is None:
+                try:
+                    _cached_data = data_loader.load_all_data()
+                except Exception as e:
+                    # Return empty state with error message
+                    _cached_data = {
+                        'data': [],
+                        'stats': {'total': 0, 'inhouse': 0, 'crossdock': 0, 'oldest_date': 'N/A'},
+                        'files': {'shipvoid': None, 'legacy': None},
+                        'error': str(e),
+                        'load_time': None
+                    }
+    return _cached_data
+
+
+def refresh_data(source_path: str = None, legacy_path: str = None) -> dict:
+    """Refresh data from source."""
+    global _cached_data, _last_refresh_paths
+    _last_refresh_paths = (source_path, legacy_path)
+    with _cache_lock:
         try:
-            _cached_data = data_loader.load_all_data()
+            _cached_data = data_loader.load_all_data(source_path, legacy_path)
         except Exception as e:
-            # Return empty state with error message
             _cached_data = {
                 'data': [],
                 'stats': {'total': 0, 'inhouse': 0, 'crossdock': 0, 'oldest_date': 'N/A'},
@@ -60,29 +117,52 @@ def get_cached_data() -> dict:
     return _cached_data
 
 
-def refresh_data(source_path: str = None, legacy_path: str = None) -> dict:
-    """Refresh data from source."""
+def start_background_refresh(source_path: str = None, legacy_path: str = None) -> bool:
+    """Start refresh_data on a worker thread; returns False if one is already running."""
+    global _refresh_thread
+    with _refresh_start_lock:
+        if is_refreshing():
+            return False
+        _refresh_thread = threading.Thread(target=refresh_data, args=(source_path, legacy_path), daemon=True)
+        _refresh_thread.start()
+    return True
+
+
+def is_refreshing() -> bool:
+    """Check whether a background refresh is in progress."""
+    return _refresh_thread is not None and _refresh_thread.is_alive()
+
+
+def clear_cached_data() -> None:
+    """Drop cached data so the next request reloads (waits for any running load)."""
     global _cached_data
-    try:
-        _cached_data = data_loader.load_all_data(source_path, legacy_path)
-    except Exception as e:
-        _cached_data = {
-            'data': [],
-            'stats': {'total': 0, 'inhouse': 0, 'crossdock': 0, 'oldest_date': 'N/A'},
-            'files': {'shipvoid': None, 'legacy': None},
-            'error': str(e),
-            'load_time': None
-        }
-    return _cached_data
+    with _cache_lock:
+        _cached_data = None
+
+
+def get_rows_json(data: dict) -> str:
+    """Serialize the table rows once per loaded dataset."""
+    global _cached_rows_json
+    if _cached_rows_json[0] is not data:
+        rows_json = orjson.dumps(data['data'], option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        _cached_rows_json = (data, rows_json)
+    return _cached_rows_json[1]
+
+
+async def auto_refresh(interval_seconds: float) -> None:
+    """Periodically reload data with the last-used paths (unchanged files hit the Parquet cache)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        start_background_refresh(*_last_refresh_paths)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Main dashboard page."""
-    data = get_cached_data()
+    data = await run_in_threadpool(get_cached_data)
     return templates.TemplateResponse("index.html", {
         "request": request,
-        "data": json.dumps(data['data']),
+        "data": get_rows_json(data),
         "stats": data['stats'],
         "error": data['error'],
         "load_time": data['load_time'],
@@ -93,11 +173,18 @@ async def index(request: Request):
 
 @app.post("/api/refresh", response_class=HTMLResponse)
 async def api_refresh(request: Request, source_path: str = Form(None), legacy_path: str = Form(None)):
-    """Refresh data from source - returns updated stats partial."""
+    """
+    Start a background refresh - returns the current stats partial; poll /api/status for completion.
+    
+    Responds 409 without starting anything if a refresh (e.g. the auto refresh) is already running.
+    """
     shipvoid_path = source_path.strip() if source_path and source_path.strip() else None
     legacy_path_clean = legacy_path.strip() if legacy_path and legacy_path.strip() else None
     
-    data = refresh_data(shipvoid_path, legacy_path_clean)
+    # An explicit refresh must see files dropped within the listing TTL
+    data_loader.clear_directory_cache()
+    started = start_background_refresh(shipvoid_path, legacy_path_clean)
+    data = _cached_data or {'stats': {}, 'error': None, 'load_time': None}
     
     # Return a partial HTML response for HTMX
     return templates.TemplateResponse("partials/stats.html", {
@@ -106,14 +193,25 @@ async def api_refresh(request: Request, source_path: str = Form(None), legacy_pa
         "error": data['error'],
         "load_time": data['load_time'],
         "source_path": config.SOURCE_PATH
-    })
+    }, status_code=200 if started else 409)
 
 
-@app.get("/api/data")
+@app.get("/api/data", response_class=ORJSONResponse)
 async def api_data():
     """Get current data as JSON."""
-    data = get_cached_data()
-    return JSONResponse(content=data)
+    data = await run_in_threadpool(get_cached_data)
+    return ORJSONResponse(content=data)
+
+
+@app.get("/api/status")
+async def api_status():
+    """Report whether a background refresh is running and when data was last loaded."""
+    data = _cached_data or {}
+    return JSONResponse(content={
+        "refreshing": is_refreshing(),
+        "load_time": data.get('load_time'),
+        "error": data.get('error'),
+    })
 
 
 @app.post("/api/config")
@@ -132,10 +230,9 @@ async def get_config():
 @app.post("/api/change-dc")
 async def change_dc(dc_code: str = Form(...)):
     """Change the current DC and update source path."""
-    global _cached_data
     try:
         new_path = config.set_current_dc(dc_code)
-        _cached_data = None  # Clear cache to force reload
+        await run_in_threadpool(clear_cached_data)  # Clear cache to force reload
         return JSONResponse(content={
             "status": "ok", 
             "dc_code": dc_code,
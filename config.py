@@ -98,6 +98,14 @@ LEGACY_PATTERN = "Legacy*.csv"
 # Fallback patterns if primary not found
 SHIPVOID_FALLBACK_PATTERNS = ["Shipvoid*.xlsx", "Shipvoid*.xls"]
 
+# Parsed DataFrames are cached here as Parquet, keyed by source path + mtime
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_DIR = os.environ.get("SHIPVOID_CACHE_DIR", DEFAULT_CACHE_DIR)
+CACHE_MAX_ENTRIES = 8  # Per source type; oldest entries are pruned first
+
+# Seconds a source directory listing is reused before re-listing the share
+DIR_LISTING_TTL = float(os.environ.get("SHIPVOID_DIR_LISTING_TTL", "30"))
+
 
 # =============================================================================
 # APPLICATION CONFIGURATION  
@@ -107,6 +115,12 @@ SHIPVOID_FALLBACK_PATTERNS = ["Shipvoid*.xlsx", "Shipvoid*.xls"]
 HOST = os.environ.get("SHIPVOID_HOST", "127.0.0.1")
 PORT = int(os.environ.get("SHIPVOID_PORT", "8050"))
 
+# Minutes between background data reloads while the dashboard runs (0 disables)
+AUTO_REFRESH_MINUTES = float(os.environ.get("SHIPVOID_AUTO_REFRESH_MINUTES", "15"))
+
+# Re-check template files on every request (set SHIPVOID_TEMPLATE_RELOAD=1 while editing)
+TEMPLATE_AUTO_RELOAD = os.environ.get("SHIPVOID_TEMPLATE_RELOAD", "0") == "1"
+
 # App metadata
 APP_TITLE = "Shipvoid Forecast Dashboard"
 APP_DESCRIPTION = "Cross-reference report for Shipvoid Forecast & Legacy Unbilled Cartons"
@@ -14,11 +14,46 @@ Data Source: SharePoint folder at:
 https://teams.wal-mart.com/:f:/r/sites/AtlasAmbientRDCPlaybookPlanning/Shared%20Documents/Shipvoid%20Forecast/6031
 """
 
+import base64
+import gzip
+import hashlib
+import os
+import tempfile
+from html import escape
+
+import numpy as np
 import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime
 
+import config
+
+# Prefer the Rust-backed calamine reader; openpyxl is the fallback, including on
+# pandas < 2.2, which has no calamine engine
+try:
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+# pyarrow runs the container_id string joins in Arrow C++; pandas string ops are the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Bump when the load/merge output columns or dtypes change so old cache files are ignored
+CACHE_VERSION = 4
+
+# Low-cardinality columns stored as pandas Categorical (int codes instead of strings)
+SHIPVOID_CATEGORICAL_COLS = ['shipvoid_status', 'source_type', 'whse_dept', 'area']
+LEGACY_CATEGORICAL_COLS = ['latest_event_status', 'latest_event_name', 'atlas_location']
+
 # Import SharePoint downloader for pulling files from Teams
 try:
     from sharepoint_downloader import download_shipvoid_files
@@ -58,45 +93,63 @@ def load_shipvoid_forecast(file_path: str) -> pd.DataFrame:
         ('Crossdock Data', 'CrossDock')
     ]
     
-    for sheet_name, source_label in sheet_configs:
-        try:
-            # Read with string dtype for columns used to build container_id
-            dtype_spec = {'Store': str, 'Div': str, 'Carton Number': str}
-            sheet_df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=dtype_spec)
-            
-            # Create container_id by concatenating Store + Div + Carton Number
-            missing_cols = [c for c in container_id_source_cols if c not in sheet_df.columns]
-            if missing_cols:
-                print(f"  Warning: Missing columns for container_id creation: {missing_cols}")
-                # If Container ID column exists as fallback, use it
-                if 'Container ID' in sheet_df.columns:
-                    sheet_df['container_id'] = sheet_df['Container ID'].astype(str).str.strip()
-                    print(f"  Using existing 'Container ID' column as fallback")
+    # Sheet-invariant read options: string dtype for the columns used to build
+    # container_id, and only the columns used below (a callable tolerates missing ones)
+    dtype_spec = {'Store': str, 'Div': str, 'Carton Number': str}
+    wanted_cols = set(columns_needed) | {'Container ID'}
+    
+    # Open the workbook once and parse each sheet from it
+    with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as workbook:
+        for sheet_name, source_label in sheet_configs:
+            try:
+                sheet_df = workbook.parse(sheet_name, dtype=dtype_spec, usecols=wanted_cols.__contains__)
+                
+                # Create container_id by concatenating Store + Div + Carton Number
+                missing_cols = [c for c in container_id_source_cols if c not in sheet_df.columns]
+                if missing_cols:
+                    print(f"  Warning: Missing columns for container_id creation: {missing_cols}")
+                    # If Container ID column exists as fallback, use it
+                    if 'Container ID' in sheet_df.columns:
+                        sheet_df['container_id'] = sheet_df['Container ID'].astype(str).str.strip()
+                        print(f"  Using existing 'Container ID' column as fallback")
+                    else:
+                        raise ValueError(f"Cannot create container_id - missing: {missing_cols}")
                 else:
-                    raise ValueError(f"Cannot create container_id - missing: {missing_cols}")
-            else:
-                # Create container_id from Store + Div + Carton Number
-                sheet_df['container_id'] = (
-                    sheet_df['Store'].astype(str).str.strip() + 
-                    sheet_df['Div'].astype(str).str.strip() + 
-                    sheet_df['Carton Number'].astype(str).str.strip()
-                )
-                print(f"  Created container_id from Store + Div + Carton Number")
-            
-            # Only select columns that exist in this sheet
-            available_cols = [c for c in columns_needed.keys() if c in sheet_df.columns]
-            sheet_df = sheet_df[available_cols + ['container_id']].rename(columns=columns_needed)
-            sheet_df['source_type'] = source_label
-            dfs.append(sheet_df)
-            print(f"  Loaded {len(sheet_df):,} records from '{sheet_name}' sheet")
-        except Exception as e:
-            print(f"  Warning: Could not load sheet '{sheet_name}': {e}")
+                    # Create container_id from Store + Div + Carton Number
+                    if PYARROW_AVAILABLE:
+                        # Blank cells become 'nan', matching astype(str) in the fallback
+                        parts = [
+                            pc.fill_null(pc.utf8_trim_whitespace(pa.array(sheet_df[c], type=pa.string(), from_pandas=True)), 'nan')
+                            for c in container_id_source_cols
+                        ]
+                        sheet_df['container_id'] = pd.Series(
+                            pc.binary_join_element_wise(*parts, ''), index=sheet_df.index, dtype='string[pyarrow]'
+                        )
+                    else:
+                        sheet_df['container_id'] = (
+                            sheet_df['Store'].astype(str).str.strip() + 
+                            sheet_df['Div'].astype(str).str.strip() + 
+                            sheet_df['Carton Number'].astype(str).str.strip()
+                        )
+                    print(f"  Created container_id from Store + Div + Carton Number")
+                
+                # Only select columns that exist in this sheet
+                # Ordered by columns_needed so both sheets line up column for column
+                present = set(sheet_df.columns)
+                available_cols = [c for c in columns_needed if c in present]
+                sheet_df = sheet_df[available_cols + ['container_id']].rename(columns=columns_needed)
+                sheet_df['source_type'] = source_label
+                dfs.append(sheet_df)
+                print(f"  Loaded {len(sheet_df):,} records from '{sheet_name}' sheet")
+            except Exception as e:
+                print(f"  Warning: Could not load sheet '{sheet_name}': {e}")
     
     if not dfs:
         raise ValueError("No data sheets found in Shipvoid Forecast file!")
     
-    # Combine all sheets
+    # Combine all sheets; concat promotes dtypes that differ between them
     df = pd.concat(dfs, ignore_index=True)
+    del dfs
     
     # Clean container_id - ensure it's a string and strip whitespace
     df['container_id'] = df['container_id'].astype(str).str.strip()
@@ -108,9 +161,24 @@ def load_shipvoid_forecast(file_path: str) -> pd.DataFrame:
     
     # Filter out VF, BILLED OR INACTIVE statuses
     excluded_statuses = ['VF', 'BILLED OR INACTIVE']
-    df['shipvoid_status'] = df['shipvoid_status'].astype(str).str.strip().str.upper()
+    if PYARROW_AVAILABLE:
+        # Trim, upper-case and test membership in Arrow kernels; blanks become
+        # 'NAN' as with astype(str).str.upper() in the fallback
+        try:
+            status = pa.array(df['shipvoid_status'], type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            status = pa.array(df['shipvoid_status'].astype(str), type=pa.string())
+        status = pc.utf8_upper(pc.utf8_trim_whitespace(pc.fill_null(status, 'nan')))
+        df['shipvoid_status'] = pd.Series(status, index=df.index, dtype='string[pyarrow]')
+        keep = pc.invert(pc.is_in(status, value_set=pa.array(excluded_statuses))).to_numpy(zero_copy_only=False)
+    else:
+        df['shipvoid_status'] = df['shipvoid_status'].astype(str).str.strip().str.upper()
+        keep = ~df['shipvoid_status'].isin(excluded_statuses).to_numpy()
+    for col in SHIPVOID_CATEGORICAL_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
     original_count = len(df)
-    df = df[~df['shipvoid_status'].isin(excluded_statuses)]
+    df = df[keep]
     filtered_count = original_count - len(df)
     print(f"  Filtered out {filtered_count:,} records with VF / BILLED OR INACTIVE status")
     print(f"  Remaining records: {len(df):,}")
@@ -121,53 +189,70 @@ def load_shipvoid_forecast(file_path: str) -> pd.DataFrame:
 def load_legacy_unbilled(file_path: str) -> pd.DataFrame:
     """Load and process the Legacy Unbilled Cartons CSV file."""
     print(f"Loading Legacy Unbilled Cartons from: {file_path}")
+    event_ts_cols = ['event_ts_1', 'event_ts_2', 'event_ts_3', 'event_ts_4', 'event_ts_5']
+    status_cols = ['status_1', 'status_2', 'status_3', 'status_4', 'status_5']
+    event_type_cols = ['event_type_1', 'event_type_2', 'event_type_3', 'event_type_4', 'event_type_5']
+    location_cols = ['location_id_1', 'location_id_2', 'location_id_3', 'location_id_4', 'location_id_5']
+    
     # Read CSV - ensure container_id is read as string to preserve leading zeros
-    df = pd.read_csv(file_path, low_memory=False, dtype={'container_id': str})
+    if PYARROW_AVAILABLE:
+        # Multithreaded Arrow reader, parsing only the columns used below that
+        # the header actually has; container_id is typed in the reader itself, since
+        # read_csv's dtype= only casts after Arrow has parsed it as an integer
+        needed_cols = ['container_id', 'container_create_date'] + event_ts_cols + status_cols + event_type_cols + location_cols
+        header = pd.read_csv(file_path, nrows=0).columns
+        df = pacsv.read_csv(file_path, convert_options=pacsv.ConvertOptions(
+            column_types={'container_id': pa.string()},
+            include_columns=[c for c in needed_cols if c in header],
+        )).to_pandas()
+    else:
+        df = pd.read_csv(file_path, low_memory=False, dtype={'container_id': str})
     
     # Clean container_id
     df['container_id'] = df['container_id'].str.strip()
     
     # Find the latest event timestamp, corresponding status, event name, and location
-    event_ts_cols = ['event_ts_1', 'event_ts_2', 'event_ts_3', 'event_ts_4', 'event_ts_5']
-    status_cols = ['status_1', 'status_2', 'status_3', 'status_4', 'status_5']
-    event_type_cols = ['event_type_1', 'event_type_2', 'event_type_3', 'event_type_4', 'event_type_5']
-    location_cols = ['location_id_1', 'location_id_2', 'location_id_3', 'location_id_4', 'location_id_5']
-    
-    # Convert event timestamps to datetime
-    for col in event_ts_cols:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-    
-    def get_latest_event(row):
-        """Find the latest event timestamp, its corresponding status, event name, and location."""
-        latest_ts = None
-        latest_status = None
-        latest_event_name = None
-        latest_location = None
-        
-        for ts_col, status_col, event_col, loc_col in zip(event_ts_cols, status_cols, event_type_cols, location_cols):
-            if ts_col in row.index and status_col in row.index:
-                ts_val = row[ts_col]
-                if pd.notna(ts_val):
-                    if latest_ts is None or ts_val > latest_ts:
-                        latest_ts = ts_val
-                        latest_status = row[status_col] if status_col in row.index else None
-                        latest_event_name = row[event_col] if event_col in row.index else None
-                        latest_location = row[loc_col] if loc_col in row.index else None
-        
-        return pd.Series({
-            'latest_event_ts': latest_ts, 
-            'latest_event_status': latest_status,
-            'latest_event_name': latest_event_name,
-            'atlas_location': latest_location
-        })
+    # Only slots with both a timestamp and a status column can produce an event
+    slots = [i for i, (ts_col, status_col) in enumerate(zip(event_ts_cols, status_cols))
+             if ts_col in df.columns and status_col in df.columns]
     
     print("  Processing event timestamps to find latest events...")
-    latest_events = df.apply(get_latest_event, axis=1)
-    df = pd.concat([df, latest_events], axis=1)
+    n_rows = len(df)
+    
+    if slots:
+        # Parse each slot's column on its own (so each infers its own format) into
+        # rows x slots; NaT is the minimum int64, so argmax skips it and takes
+        # the earliest slot on ties
+        ts_arr = np.column_stack([
+            pd.to_datetime(df[event_ts_cols[i]], errors='coerce').to_numpy(dtype='datetime64[ns]')
+            for i in slots
+        ])
+        idx = ts_arr.view('i8').argmax(axis=1)[:, None]
+        latest_ts = np.take_along_axis(ts_arr, idx, axis=1).ravel()
+        has_event = ~np.isnat(latest_ts)
+    else:
+        latest_ts = np.full(n_rows, np.datetime64('NaT'), dtype='datetime64[ns]')
+        has_event = np.zeros(n_rows, dtype=bool)
+    
+    def gather(cols):
+        """Pick the value from each row's latest event slot, None where there is no event."""
+        if not slots:
+            return np.full(n_rows, None, dtype=object)
+        arr = np.column_stack([
+            df[cols[i]].to_numpy(dtype=object) if cols[i] in df.columns else np.full(n_rows, None, dtype=object)
+            for i in slots
+        ])
+        return np.where(has_event, np.take_along_axis(arr, idx, axis=1).ravel(), None)
+    
+    df['latest_event_ts'] = latest_ts
+    df['latest_event_status'] = gather(status_cols)
+    df['latest_event_name'] = gather(event_type_cols)
+    df['atlas_location'] = gather(location_cols)
     
     # Select only needed columns
     result = df[['container_id', 'container_create_date', 'latest_event_ts', 'latest_event_status', 'latest_event_name', 'atlas_location']].copy()
+    for col in LEGACY_CATEGORICAL_COLS:
+        result[col] = result[col].astype('category')
     
     print(f"  Loaded {len(result):,} records from Legacy Unbilled Cartons")
     return result
@@ -182,82 +267,107 @@ def merge_data(shipvoid_df: pd.DataFrame, legacy_df: pd.DataFrame) -> pd.DataFra
     """
     print("Merging datasets on container_id...")
     
-    # Ensure container_create_date is parsed as datetime
+    # Carry the create date as a single day-resolution datetime64 column rather
+    # than datetime plus a column of Python date objects
     legacy_df = legacy_df.copy()
-    legacy_df['container_create_date'] = pd.to_datetime(legacy_df['container_create_date'], errors='coerce')
-    legacy_df['container_create_date_only'] = legacy_df['container_create_date'].dt.date
-    
-    # Group legacy data by container_id, taking the latest event
-    legacy_grouped = legacy_df.sort_values('latest_event_ts', ascending=False)
-    legacy_grouped = legacy_grouped.drop_duplicates(subset='container_id', keep='first')
-    
-    # Merge on container_id
-    merged = pd.merge(
-        shipvoid_df,
-        legacy_grouped[['container_id', 'container_create_date', 'container_create_date_only', 'latest_event_ts', 'latest_event_status', 'latest_event_name', 'atlas_location']],
-        on='container_id',
-        how='left'
+    legacy_df['container_create_day'] = (
+        pd.to_datetime(legacy_df['container_create_date'], errors='coerce').to_numpy(dtype='datetime64[D]')
     )
     
-    # Timeline validation: filter out records where container_create_date doesn't match label_date
-    # This prevents matching re-used/wrapped container IDs from different time periods
-    pre_filter_count = len(merged)
+    # Group legacy data by container_id, taking the latest event; containers
+    # without any event timestamp carry no legacy fields, so they are left out
+    has_event = legacy_df['latest_event_ts'].notna()
+    latest_idx = legacy_df[has_event].groupby('container_id', sort=False)['latest_event_ts'].idxmax()
+    legacy_grouped = legacy_df.loc[latest_idx]
     
-    # Only validate where both dates exist
-    has_both_dates = merged['label_date'].notna() & merged['container_create_date_only'].notna()
+    # Left join on container_id; legacy_grouped is unique per container, so an
+    # index lookup replaces a full two-sided merge
+    legacy_indexed = legacy_grouped.set_index('container_id')[['container_create_day', 'latest_event_ts', 'latest_event_status', 'latest_event_name', 'atlas_location']]
+    merged = shipvoid_df.join(legacy_indexed, on='container_id', how='left').reset_index(drop=True)
     
-    # Check if dates match (allowing for same-day match)
-    dates_match = merged['label_date'] == merged['container_create_date_only']
-    
-    # Keep records where: no legacy match found OR dates match
-    no_legacy_match = merged['container_create_date_only'].isna()
-    valid_timeline = no_legacy_match | dates_match
+    # Timeline validation: filter out records where container_create_date doesn't match label_date
+    # This prevents matching re-used/wrapped container IDs from different time periods
+    label_day = pd.to_datetime(merged['label_date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+    create_day = merged['container_create_day'].to_numpy(dtype='datetime64[D]')
     
-    # For mismatched timelines, clear the legacy data (treat as no match)
-    timeline_mismatch = has_both_dates & ~dates_match
+    # For mismatched timelines, clear the legacy data (treat as no match); only
+    # rows where both dates exist are validated, in one fused mask
+    timeline_mismatch = ~np.isnat(label_day) & ~np.isnat(create_day) & (label_day != create_day)
     mismatch_count = timeline_mismatch.sum()
     
     if mismatch_count > 0:
         print(f"  Timeline validation: {mismatch_count:,} records had mismatched container_create_date vs label_date")
         print(f"  These container IDs are likely re-used/wrapped - clearing legacy match data")
-        # Clear legacy data for mismatched records instead of dropping them
-        merged.loc[timeline_mismatch, ['container_create_date', 'container_create_date_only', 'latest_event_ts', 'latest_event_status', 'latest_event_name', 'atlas_location']] = None
+        # Clear legacy data for mismatched records instead of dropping them;
+        # Series.mask nulls each column in its own dtype
+        for col in ['latest_event_ts', 'latest_event_status', 'latest_event_name', 'atlas_location']:
+            merged[col] = merged[col].mask(timeline_mismatch)
     else:
         print(f"  Timeline validation: All matched records have consistent dates")
     
     # Drop the helper column
-    merged = merged.drop(columns=['container_create_date_only', 'container_create_date'], errors='ignore')
-    
-    # Group by container_id to consolidate multiple items per container
-    # Keep first occurrence of each container (they should have same status)
-    # Build aggregation dict dynamically based on available columns
-    agg_cols = {
-        'item': 'first',
-        'item_description': 'first',
-        'po': 'first',
-        'shipvoid_status': 'first',
-        'label_date': 'first',
-        'store': 'first',
-        'div': 'first',
-        'carton_number': 'first',
-        'whse_dept': 'first',
-        'area': 'first',
-        'slot': 'first',
-        'source_type': 'first',
-        'latest_event_ts': 'first',
-        'latest_event_status': 'first',
-        'latest_event_name': 'first',
-        'atlas_location': 'first'
-    }
+    merged = merged.drop(columns=['container_create_day'])
+    
+    # Consolidate multiple items per container, keeping the first non-null value
+    # of every column (they should have same status); rows stay in sheet order
+    keep_cols = [
+        'item', 'item_description', 'po', 'shipvoid_status', 'label_date',
+        'store', 'div', 'carton_number', 'whse_dept', 'area', 'slot',
+        'source_type', 'latest_event_ts', 'latest_event_status',
+        'latest_event_name', 'atlas_location'
+    ]
     # Only include columns that exist in the merged dataframe
-    agg_cols = {k: v for k, v in agg_cols.items() if k in merged.columns}
+    keep_cols = [c for c in keep_cols if c in merged.columns]
     
-    merged_grouped = merged.groupby('container_id').agg(agg_cols).reset_index()
+    merged_grouped = merged[['container_id'] + keep_cols].groupby('container_id', sort=False, as_index=False).first()
     
     print(f"  Merged data contains {len(merged_grouped):,} unique containers")
     return merged_grouped
 
 
+def load_merged_data(shipvoid_file: str, legacy_file: str) -> pd.DataFrame:
+    """Load and merge both inputs, reusing a Parquet copy of the result while neither file changes."""
+    if not PYARROW_AVAILABLE:
+        return merge_data(load_shipvoid_forecast(shipvoid_file), load_legacy_unbilled(legacy_file))
+    
+    key_src = "|".join(
+        [str(CACHE_VERSION)] + [f"{os.path.abspath(f)}|{os.path.getmtime(f)}" for f in (shipvoid_file, legacy_file)]
+    )
+    key = hashlib.sha1(key_src.encode()).hexdigest()
+    cache_dir = Path(config.CACHE_DIR)
+    cache_file = cache_dir / f"report_{key}.parquet"
+    
+    if cache_file.exists():
+        try:
+            merged_df = pd.read_parquet(cache_file)
+            print(f"Using cached merged data ({len(merged_df):,} containers) - inputs unchanged")
+            return merged_df
+        except Exception as e:
+            print(f"  Warning: Could not read cache {cache_file.name}: {e}")
+    
+    merged_df = merge_data(load_shipvoid_forecast(shipvoid_file), load_legacy_unbilled(legacy_file))
+    
+    tmp_path = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name and swap it in, so no reader ever sees a
+        # half-written file under a valid key
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".report_", suffix=".tmp")
+        os.close(fd)
+        merged_df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+        entries = sorted(cache_dir.glob("report_*.parquet"), key=os.path.getmtime, reverse=True)
+        for stale in entries[config.CACHE_MAX_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except Exception as e:
+        print(f"  Warning: Could not write report cache: {e}")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+    
+    return merged_df
+
+
 def generate_pivot_data(df: pd.DataFrame) -> dict:
     """Generate pivot data for the dashboard - container count by date."""
     # Group by label_date and count containers
@@ -276,14 +386,42 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
     print(f"Generating HTML report: {output_path}")
     
     # Prepare table data
-    df_display = df.copy()
+    # label_date_str is generate_pivot_data's grouping helper, a copy of label_date
+    df_display = df.drop(columns=['label_date_str'], errors='ignore')
     df_display['label_date'] = df_display['label_date'].astype(str)
-    df_display['latest_event_ts'] = df_display['latest_event_ts'].apply(
-        lambda x: x.strftime('%Y-%m-%d %H:%M:%S') if pd.notna(x) else ''
-    )
+    event_ts = pd.to_datetime(df_display['latest_event_ts'], errors='coerce')
+    df_display['latest_event_ts'] = event_ts.dt.strftime('%Y-%m-%d %H:%M:%S').fillna('')
+    # Categoricals need '' as a category before fillna can use it
+    for col in df_display.select_dtypes('category').columns:
+        if '' not in df_display[col].cat.categories:
+            df_display[col] = df_display[col].cat.add_categories('')
     df_display = df_display.fillna('')
     
-    table_data = df_display.to_dict('records')
+    def filter_options(col: str) -> str:
+        """Pre-render a filter's <option> tags from the values present in this run."""
+        if col not in df_display.columns:
+            return ''
+        values = set()
+        for v in df_display[col].unique():
+            if pd.isna(v) or v == '' or v == 0:
+                continue
+            # Match how the browser would print the JSON value
+            values.add(str(int(v)) if isinstance(v, float) and v.is_integer() else str(v))
+        return ''.join(f'<option value="{escape(v)}">{escape(v)}</option>' for v in sorted(values))
+    
+    source_counts = df_display['source_type'].value_counts()
+    inhouse_count = int(source_counts.get('In House', 0))
+    crossdock_count = int(source_counts.get('CrossDock', 0))
+    
+    # Serialize straight from the frame in pandas' C JSON writer instead of
+    # materializing a list of per-row dicts first; the page keeps one array
+    # per column and addresses rows by index
+    table_json = '{' + ','.join(
+        f'{json.dumps(str(col))}:{df_display[col].to_json(orient="records", double_precision=15)}'
+        for col in df_display.columns
+    ) + '}'
+    # Embedded compressed; the page inflates it with DecompressionStream on load
+    table_payload = base64.b64encode(gzip.compress(table_json.encode('utf-8'), compresslevel=6)).decode('ascii')
     
     html_content = f'''<!DOCTYPE html>
 <html lang="en">
@@ -291,7 +429,6 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>RDC 6006 Cullman, AL - Shipvoid Forecast vs Legacy Unbilled Cartons</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
         :root {{
             --primary-color: #0071ce;
@@ -401,6 +538,12 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
             position: relative;
         }}
         
+        .chart-container canvas {{
+            display: block;
+            width: 100%;
+            height: 100%;
+        }}
+        
         .table-section {{
             background: var(--card-bg);
             border-radius: 12px;
@@ -662,11 +805,11 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
                     <div class="stat-label">Total Picks</div>
                 </div>
                 <div class="stat-card secondary">
-                    <div class="stat-value" id="inhouse-picks">0</div>
+                    <div class="stat-value" id="inhouse-picks">{inhouse_count:,}</div>
                     <div class="stat-label">Total Inhouse Picks</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value" id="crossdock-picks">0</div>
+                    <div class="stat-value" id="crossdock-picks">{crossdock_count:,}</div>
                     <div class="stat-label">Total CrossDock Picks</div>
                 </div>
                 <div class="stat-card secondary">
@@ -691,26 +834,33 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
                     </select>
                     <select id="statusFilter" class="filter-input">
                         <option value="">All Shipvoid Statuses</option>
+                        {filter_options('shipvoid_status')}
                     </select>
                     <select id="whseDeptFilter" class="filter-input">
                         <option value="">All Whse Depts</option>
+                        {filter_options('whse_dept')}
                     </select>
                     <select id="areaFilter" class="filter-input">
                         <option value="">All Areas</option>
+                        {filter_options('area')}
                     </select>
                     <select id="slotFilter" class="filter-input">
                         <option value="">All Slots</option>
+                        {filter_options('slot')}
                     </select>
                     <select id="latestStatusFilter" class="filter-input">
                         <option value="">All Atlas Statuses</option>
                         <option value="__BLANK__">-- Blank (Not in Legacy) --</option>
+                        {filter_options('latest_event_status')}
                     </select>
                     <select id="latestEventNameFilter" class="filter-input">
                         <option value="">All Event Names</option>
                         <option value="__BLANK__">-- Blank (Not in Legacy) --</option>
+                        {filter_options('latest_event_name')}
                     </select>
                     <select id="dateFilter" class="filter-input">
                         <option value="">All Dates</option>
+                        {filter_options('label_date')}
                     </select>
                     <button class="btn secondary" onclick="resetFilters()">Reset</button>
                     <button class="btn" onclick="exportToCSV()">Export CSV</button>
@@ -759,197 +909,758 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
         </div>
     </div>
     
-    <script>
-        // Data
-        const allData = {json.dumps(table_data)};
+    <script type="module">
+        // The table JSON is embedded gzip-compressed and base64-encoded to keep the file small
+        async function decodePayload(base64) {{
+            if (typeof DecompressionStream === 'undefined') {{
+                // Say why the table is empty instead of failing silently
+                const message = 'This report needs a newer browser to load its data (Chrome/Edge 80+, Firefox 113+ or Safari 16.4+).';
+                const banner = document.createElement('div');
+                banner.textContent = message;
+                banner.style.cssText = 'background:#fdecea;color:#b71c1c;border:1px solid #f5c2c0;border-radius:8px;padding:16px;margin-bottom:20px;font-weight:600;';
+                document.querySelector('.container').prepend(banner);
+                throw new Error(message);
+            }}
+            const binary = atob(base64);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return JSON.parse(await new Response(stream).text());
+        }}
+        
+        // Data: one array per column, addressed by row index
+        const columns = await decodePayload('{table_payload}');
         const pivotData = {json.dumps(pivot_data)};
+        const rowCount = columns.container_id.length;
+        
+        // Missing columns read as undefined, like a missing key on a row object
+        function column(name) {{
+            return columns[name] || new Array(rowCount);
+        }}
+        const containerIdCol = column('container_id');
+        const sourceTypeCol = column('source_type');
+        const itemCol = column('item');
+        const itemDescriptionCol = column('item_description');
+        const poCol = column('po');
+        const whseDeptCol = column('whse_dept');
+        const areaCol = column('area');
+        const slotCol = column('slot');
+        const shipvoidStatusCol = column('shipvoid_status');
+        const latestEventTsCol = column('latest_event_ts');
+        const latestEventNameCol = column('latest_event_name');
+        const latestEventStatusCol = column('latest_event_status');
+        const atlasLocationCol = column('atlas_location');
+        const labelDateCol = column('label_date');
+        
+        // Dictionary-encode the dropdown-filtered columns once so filters compare integer codes;
+        // sorted dictionaries are ordered the way the chart orders its date labels
+        function encode(col, sorted = false) {{
+            const dict = [];
+            const codeOf = new Map();
+            const codes = new Uint32Array(rowCount);
+            for (let i = 0; i < rowCount; i++) {{
+                const value = col[i];
+                let code = codeOf.get(value);
+                if (code === undefined) {{
+                    code = dict.length;
+                    codeOf.set(value, code);
+                    dict.push(value);
+                }}
+                codes[i] = code;
+            }}
+            if (sorted) {{
+                const order = dict.map((_, code) => code).sort((a, b) => {{
+                    const keyA = String(dict[a]);
+                    const keyB = String(dict[b]);
+                    return keyA < keyB ? -1 : keyA > keyB ? 1 : 0;
+                }});
+                const remap = new Uint32Array(dict.length);
+                order.forEach((code, rank) => {{ remap[code] = rank; }});
+                for (let i = 0; i < rowCount; i++) codes[i] = remap[codes[i]];
+                const sortedDict = order.map(code => dict[code]);
+                dict.length = 0;
+                dict.push(...sortedDict);
+                codeOf.clear();
+                dict.forEach((value, code) => codeOf.set(value, code));
+            }}
+            // Codes whose value counts as blank for the "Not in Legacy" options
+            const blank = Uint8Array.from(dict, value => value ? 0 : 1);
+            return {{dict, codeOf, blank, codes: dict.length <= 65536 ? Uint16Array.from(codes) : codes}};
+        }}
+        const sourceTypeEnc = encode(sourceTypeCol);
+        const shipvoidStatusEnc = encode(shipvoidStatusCol);
+        const whseDeptEnc = encode(whseDeptCol);
+        const areaEnc = encode(areaCol);
+        const slotEnc = encode(slotCol);
+        const latestEventStatusEnc = encode(latestEventStatusCol);
+        const latestEventNameEnc = encode(latestEventNameCol);
+        const labelDateEnc = encode(labelDateCol, true);
+        const allDateCounts = new Uint32Array(labelDateEnc.dict.length);
+        for (let i = 0; i < rowCount; i++) allDateCounts[labelDateEnc.codes[i]]++;
+        
+        const NO_FILTER = -1;
+        const NO_MATCH = -2;
+        const BLANK_FILTER = -3;
+        
+        // Resolve a dropdown value to the code rows must carry
+        function filterCode(enc, value, allowBlank = false) {{
+            if (!value) return NO_FILTER;
+            if (allowBlank && value === '__BLANK__') return BLANK_FILTER;
+            const code = enc.codeOf.get(value);
+            return code === undefined ? NO_MATCH : code;
+        }}
+        
+        // Everything the filter and sort passes read; handed to the worker once on load
+        const tableData = {{
+            rowCount,
+            dateCount: labelDateEnc.dict.length,
+            columns,
+            // Columns whose sort keys are read as typed numbers rather than strings
+            timestampColumns: ['latest_event_ts'],
+            dicts: {{
+                source_type: sourceTypeEnc.dict,
+                shipvoid_status: shipvoidStatusEnc.dict,
+                whse_dept: whseDeptEnc.dict,
+                area: areaEnc.dict,
+                slot: slotEnc.dict,
+                latest_event_status: latestEventStatusEnc.dict,
+                latest_event_name: latestEventNameEnc.dict,
+                label_date: labelDateEnc.dict
+            }},
+            codes: {{
+                source_type: sourceTypeEnc.codes,
+                shipvoid_status: shipvoidStatusEnc.codes,
+                whse_dept: whseDeptEnc.codes,
+                area: areaEnc.codes,
+                slot: slotEnc.codes,
+                latest_event_status: latestEventStatusEnc.codes,
+                latest_event_name: latestEventNameEnc.codes,
+                label_date: labelDateEnc.codes
+            }},
+            blank: {{
+                latest_event_status: latestEventStatusEnc.blank,
+                latest_event_name: latestEventNameEnc.blank
+            }}
+        }};
+        
+        // Dropdown filters as [column, code] pairs, skipping the ones left on "All"
+        function activeFilters(query) {{
+            return [
+                ['source_type', query.source],                  // Source filter (In House / CrossDock)
+                ['shipvoid_status', query.status],              // Shipvoid Status filter
+                ['whse_dept', query.whseDept],                  // Whse Dept filter
+                ['area', query.area],                           // Area filter
+                ['slot', query.slot],                           // Slot filter
+                ['latest_event_status', query.latestStatus],    // Atlas Status filter
+                ['latest_event_name', query.latestEventName],   // Latest Event Name filter
+                ['label_date', query.date]                      // Date filter
+            ].filter(([, code]) => code !== NO_FILTER);
+        }}
+        
+        // One byte per row marking the rows that pass a single dropdown filter. The last
+        // mask per column is kept, so changing one dropdown only rebuilds that column's.
+        function columnMask(data, column, code) {{
+            const masks = data.masks || (data.masks = {{}});
+            if (masks[column] && masks[column].code === code) return masks[column].mask;
+            const codes = data.codes[column];
+            const mask = new Uint8Array(data.rowCount);
+            if (code === BLANK_FILTER) {{
+                // Blank/empty values: rows not found in the Legacy report
+                const blank = data.blank[column];
+                for (let i = 0; i < data.rowCount; i++) mask[i] = blank[codes[i]];
+            }} else {{
+                for (let i = 0; i < data.rowCount; i++) mask[i] = codes[i] === code ? 1 : 0;
+            }}
+            masks[column] = {{code, mask}};
+            return mask;
+        }}
+        
+        // AND of the active dropdown masks, or null when no dropdown is set
+        function combinedMask(data, filters) {{
+            if (filters.length === 0) return null;
+            if (filters.length === 1) return columnMask(data, filters[0][0], filters[0][1]);
+            const mask = columnMask(data, filters[0][0], filters[0][1]).slice();
+            for (let f = 1; f < filters.length; f++) {{
+                const other = columnMask(data, filters[f][0], filters[f][1]);
+                for (let i = 0; i < mask.length; i++) mask[i] &= other[i];
+            }}
+            return mask;
+        }}
+        
+        // Lowercased text of every row's cells joined, built the first time a search needs
+        // it, so reports only filtered by dropdown never pay for it
+        function searchText(data) {{
+            if (!data.searchStrings) {{
+                const cols = Object.values(data.columns);
+                data.searchStrings = Array.from({{length: data.rowCount}}, (_, i) => cols.map(col => col[i]).join(' ').toLowerCase());
+            }}
+            return data.searchStrings;
+        }}
+        
+        // Collection loop compiled for one shape of query, so rows only pay for the checks
+        // that query needs. Kernels are cached per shape: whether a candidate list, a mask
+        // and a search term are in play and, for candidate scans, which dropdowns are set
+        // (their codes are passed in, not baked in). Null where eval is blocked.
+        function compileFilterLoop(data, useScan, useMask, useSearch, filters) {{
+            const kernels = data.kernels || (data.kernels = new Map());
+            const key = [useScan, useMask, useSearch, ...filters.map(([column, code]) => code === BLANK_FILTER ? column + ':blank' : column)].join('|');
+            if (kernels.has(key)) return kernels.get(key);
+            
+            let body = 'let count = 0;\\n';
+            filters.forEach(([column, code], f) => {{
+                const name = JSON.stringify(column);
+                body += code === BLANK_FILTER
+                    ? `const c${{f}} = codes[${{name}}], b${{f}} = blank[${{name}}];\\n`
+                    : `const c${{f}} = codes[${{name}}], v${{f}} = values[${{f}}];\\n`;
+            }});
+            body += useScan ? 'for (let k = 0; k < scanCount; k++) {{\\nconst i = scan[k];\\n' : 'for (let i = 0; i < scanCount; i++) {{\\n';
+            if (useMask) body += 'if (!mask[i]) continue;\\n';
+            filters.forEach(([, code], f) => {{
+                body += code === BLANK_FILTER ? `if (!b${{f}}[c${{f}}[i]]) continue;\\n` : `if (c${{f}}[i] !== v${{f}}) continue;\\n`;
+            }});
+            if (useSearch) body += 'if (!searchStrings[i].includes(searchTerm)) continue;\\n';
+            body += 'idx[count++] = i;\\ndateCounts[dateCodes[i]]++;\\n}}\\nreturn count;';
+            
+            let kernel = null;
+            try {{
+                kernel = new Function('scan', 'scanCount', 'mask', 'searchStrings', 'searchTerm', 'codes', 'blank', 'values', 'dateCodes', 'idx', 'dateCounts', body);
+            }} catch (err) {{
+                // A content security policy without 'unsafe-eval'; the generic loop still works
+                kernel = null;
+            }}
+            kernels.set(key, kernel);
+            return kernel;
+        }}
+        
+        // Filter pass: returns the surviving row indices for a set of resolved filter codes,
+        // and counts the survivors per label date code for the chart along the way. A full
+        // pass ANDs per-column masks; given the candidates in scan (a stricter query) it
+        // checks those few rows' codes directly rather than building masks over every row.
+        // Must stay self-contained, its source is also what the worker runs.
+        function filterRows(data, query, scan) {{
+            const {{rowCount, dateCount, codes, blank}} = data;
+            const searchTerm = query.searchTerm;
+            const searchStrings = searchTerm ? searchText(data) : null;
+            const filters = activeFilters(query);
+            const mask = scan ? null : combinedMask(data, filters);
+            const scanCount = scan ? scan.length : rowCount;
+            const idx = new Uint32Array(scanCount);
+            const dateCounts = new Uint32Array(dateCount);
+            const kernel = compileFilterLoop(data, !!scan, !!mask, !!searchTerm, scan ? filters : []);
+            if (kernel) {{
+                const values = filters.map(([, code]) => code);
+                const count = kernel(scan, scanCount, mask, searchStrings, searchTerm, codes, blank, values, codes.label_date, idx, dateCounts);
+                return {{idx, count, dateCounts}};
+            }}
+            let count = 0;
+            rows: for (let k = 0; k < scanCount; k++) {{
+                const i = scan ? scan[k] : k;
+                if (mask && !mask[i]) continue;
+                if (scan) {{
+                    for (const [column, code] of filters) {{
+                        const rowCode = codes[column][i];
+                        if (code === BLANK_FILTER ? !blank[column][rowCode] : rowCode !== code) continue rows;
+                    }}
+                }}
+                
+                // Search filter
+                if (searchTerm && !searchStrings[i].includes(searchTerm)) continue;
+                
+                idx[count++] = i;
+                dateCounts[codes.label_date[i]]++;
+            }}
+            return {{idx, count, dateCounts}};
+        }}
+        
+        function isBlank(value) {{
+            return value === null || value === undefined || value === '';
+        }}
+        
+        // Dense rank of every distinct value. Keys share one type per column so the
+        // comparison is consistent: numbers when every non-blank value is a number,
+        // otherwise case-insensitive text. Blanks share rank 0, ahead of every value,
+        // as in timestampKeys.
+        function rankValues(values) {{
+            let numeric = true;
+            for (const value of values) {{
+                if (!isBlank(value) && typeof value !== 'number') {{
+                    numeric = false;
+                    break;
+                }}
+            }}
+            const sortKey = value => isBlank(value) ? null : numeric ? value : String(value).toLowerCase();
+            const keys = [...new Set(Array.from(values, sortKey))].filter(key => key !== null);
+            keys.sort(numeric ? (a, b) => a - b : (a, b) => a < b ? -1 : a > b ? 1 : 0);
+            const rankOf = new Map(keys.map((key, k) => [key, k + 1]));
+            rankOf.set(null, 0);
+            return {{rank: value => rankOf.get(sortKey(value)), rankCount: keys.length + 1}};
+        }}
+        
+        // 'YYYY-MM-DD HH:MM:SS' timestamps as the number YYYYMMDDhhmmss, which orders the
+        // same way the strings do, with blanks first; null if any cell has another shape
+        function timestampKeys(col, rowCount) {{
+            const SEPARATORS = {{4: 45, 7: 45, 10: 32, 13: 58, 16: 58}};
+            const keys = new Float64Array(rowCount);
+            for (let i = 0; i < rowCount; i++) {{
+                const text = col[i];
+                if (!text) {{
+                    keys[i] = -1;
+                    continue;
+                }}
+                if (typeof text !== 'string' || text.length !== 19) return null;
+                let key = 0;
+                for (let j = 0; j < 19; j++) {{
+                    const c = text.charCodeAt(j);
+                    if (j in SEPARATORS) {{
+                        if (c !== SEPARATORS[j]) return null;
+                        continue;
+                    }}
+                    if (c < 48 || c > 57) return null;
+                    key = key * 10 + (c - 48);
+                }}
+                keys[i] = key;
+            }}
+            return keys;
+        }}
+        
+        // Dense rank of every row's sort key in one column, built on the first sort by it.
+        // Dictionary-encoded columns rank their few distinct values and gather by code,
+        // timestamps rank typed numeric keys; anything else ranks the strings themselves.
+        function columnRanks(data, column) {{
+            const ranks = data.ranks || (data.ranks = {{}});
+            if (ranks[column]) return ranks[column];
+            const rowCount = data.rowCount;
+            const col = column in data.columns ? data.columns[column] : new Array(rowCount);
+            const rowRanks = new Uint32Array(rowCount);
+            const dict = data.dicts[column];
+            const stamps = dict ? null : data.timestampColumns.includes(column) ? timestampKeys(col, rowCount) : null;
+            let rankCount;
+            if (dict) {{
+                const ranked = rankValues(dict);
+                const dictRanks = Uint32Array.from(dict, ranked.rank);
+                const codes = data.codes[column];
+                for (let i = 0; i < rowCount; i++) rowRanks[i] = dictRanks[codes[i]];
+                rankCount = ranked.rankCount;
+            }} else if (stamps) {{
+                const distinct = Float64Array.from(new Set(stamps)).sort();
+                for (let i = 0; i < rowCount; i++) {{
+                    let lo = 0;
+                    let hi = distinct.length - 1;
+                    while (lo < hi) {{
+                        const mid = (lo + hi) >> 1;
+                        if (distinct[mid] < stamps[i]) lo = mid + 1;
+                        else hi = mid;
+                    }}
+                    rowRanks[i] = lo;
+                }}
+                rankCount = distinct.length;
+            }} else {{
+                const ranked = rankValues(col);
+                for (let i = 0; i < rowCount; i++) rowRanks[i] = ranked.rank(col[i]);
+                rankCount = ranked.rankCount;
+            }}
+            ranks[column] = {{rowRanks, rankCount}};
+            return ranks[column];
+        }}
+        
+        // Sort pass: orders the first count entries of idx by one column with a counting
+        // sort over its ranks; stable, so ties keep their current order
+        function sortRows(data, idx, count, column, direction) {{
+            const {{rowRanks, rankCount}} = columnRanks(data, column);
+            const descending = direction !== 'asc';
+            const starts = new Uint32Array(rankCount + 1);
+            for (let k = 0; k < count; k++) {{
+                const rank = rowRanks[idx[k]];
+                starts[(descending ? rankCount - 1 - rank : rank) + 1]++;
+            }}
+            for (let r = 1; r <= rankCount; r++) starts[r] += starts[r - 1];
+            const sorted = new Uint32Array(count);
+            for (let k = 0; k < count; k++) {{
+                const rank = rowRanks[idx[k]];
+                sorted[starts[descending ? rankCount - 1 - rank : rank]++] = idx[k];
+            }}
+            return {{idx: sorted, count}};
+        }}
+        
+        function runJob(data, job) {{
+            if (job.type === 'filter') return filterRows(data, job.query, job.scan);
+            return sortRows(data, job.idx, job.count, job.column, job.direction);
+        }}
+        
+        // Filter/sort jobs run in a worker built from the functions above so large reports
+        // keep scrolling and typing responsive; without one they run inline.
+        // Results come back as transferred buffers: SharedArrayBuffer needs cross-origin
+        // isolation, which a report opened from disk never has.
+        const workerSource = `
+            const NO_FILTER = ${{NO_FILTER}};
+            const BLANK_FILTER = ${{BLANK_FILTER}};
+            ${{searchText}}
+            ${{activeFilters}}
+            ${{columnMask}}
+            ${{combinedMask}}
+            ${{compileFilterLoop}}
+            ${{filterRows}}
+            ${{isBlank}}
+            ${{rankValues}}
+            ${{timestampKeys}}
+            ${{columnRanks}}
+            ${{sortRows}}
+            ${{runJob}}
+            let data = null;
+            self.onmessage = e => {{
+                const job = e.data;
+                if (job.type === 'init') {{
+                    data = job.data;
+                    return;
+                }}
+                const result = runJob(data, job);
+                const transfer = result.dateCounts ? [result.idx.buffer, result.dateCounts.buffer] : [result.idx.buffer];
+                self.postMessage({{...result, id: job.id}}, transfer);
+            }};
+        `;
+        let worker = null;
+        let nextJobId = 0;
+        const pendingJobs = new Map();
+        let jobQueue = Promise.resolve();
+        
+        function startWorker() {{
+            if (typeof Worker === 'undefined') return;
+            try {{
+                worker = new Worker(URL.createObjectURL(new Blob([workerSource], {{ type: 'text/javascript' }})));
+            }} catch (err) {{
+                // Blob workers can be blocked (e.g. by a content security policy)
+                worker = null;
+                return;
+            }}
+            worker.onmessage = e => {{
+                const pending = pendingJobs.get(e.data.id);
+                pendingJobs.delete(e.data.id);
+                pending.resolve(e.data);
+            }};
+            worker.onerror = () => {{
+                // Finish anything in flight inline and stay on the main thread from here on
+                worker.terminate();
+                worker = null;
+                pendingJobs.forEach(pending => pending.resolve(runJob(tableData, pending.job)));
+                pendingJobs.clear();
+            }};
+            worker.postMessage({{type: 'init', data: tableData}});
+        }}
+        
+        function postJob(job) {{
+            if (!worker) return Promise.resolve(runJob(tableData, job));
+            return new Promise(resolve => {{
+                const id = nextJobId++;
+                pendingJobs.set(id, {{resolve, job}});
+                worker.postMessage({{...job, id}});
+            }});
+        }}
         
-        // State
-        let filteredData = [...allData];
+        // Jobs apply in the order they were requested, each to the result of the one before
+        function enqueue(step) {{
+            jobQueue = jobQueue.then(step);
+            return jobQueue;
+        }}
+        
+        // State: the first filteredCount entries of filteredIdx are the visible rows, in display order
+        let filteredIdx = new Uint32Array(rowCount);
+        let filteredCount = 0;
+        // Query and row-order result of the last filter pass, so stricter queries rescan only its rows
+        let lastFilter = null;
+        // Recent filter results by query, least recently used first, so toggling back is free
+        const filterCache = new Map();
+        const FILTER_CACHE_SIZE = 16;
+        
+        function cachedFilter(key) {{
+            const result = filterCache.get(key);
+            if (result) {{
+                filterCache.delete(key);
+                filterCache.set(key, result);
+            }}
+            return result;
+        }}
+        
+        function rememberFilter(key, result) {{
+            filterCache.set(key, result);
+            if (filterCache.size > FILTER_CACHE_SIZE) filterCache.delete(filterCache.keys().next().value);
+        }}
         let currentPage = 1;
         let pageSize = 50;
         let sortColumn = null;
         let sortDirection = 'asc';
         
-        // Initialize
-        document.addEventListener('DOMContentLoaded', function() {{
-            initChart();
-            initFilters();
-            updateStats();
-            renderTable();
-        }});
+        function selectAllRows() {{
+            filteredIdx = new Uint32Array(rowCount);
+            for (let i = 0; i < rowCount; i++) filteredIdx[i] = i;
+            filteredCount = rowCount;
+        }}
+        selectAllRows();
         
+        // Date histogram drawn straight onto the canvas: one bar series, y ticks from zero
         let dateChart = null;
+        // Counts the chart last drew, and whether a redraw is queued or waiting for it to scroll into view
+        let chartCounts = null;
+        let chartFrame = null;
+        let chartVisible = true;
+        let chartStale = false;
+        
+        const CHART_BAR_FILL = 'rgba(0, 113, 206, 0.8)';
+        const CHART_BAR_BORDER = 'rgba(0, 113, 206, 1)';
+        const CHART_GRID = 'rgba(0, 0, 0, 0.1)';
+        const CHART_TEXT = '#666';
+        const CHART_FONT = '12px sans-serif';
         
         function initChart() {{
-            const ctx = document.getElementById('dateChart').getContext('2d');
-            dateChart = new Chart(ctx, {{
-                type: 'bar',
-                data: {{
-                    labels: pivotData.dates,
-                    datasets: [{{
-                        label: 'Container Count',
-                        data: pivotData.counts,
-                        backgroundColor: 'rgba(0, 113, 206, 0.8)',
-                        borderColor: 'rgba(0, 113, 206, 1)',
-                        borderWidth: 1
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
-                            display: false
-                        }}
-                    }},
-                    scales: {{
-                        y: {{
-                            beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return value.toLocaleString();
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
+            const canvas = document.getElementById('dateChart');
+            dateChart = {{canvas, ctx: canvas.getContext('2d'), labels: pivotData.dates, counts: pivotData.counts, plot: null}};
+            if (typeof IntersectionObserver !== 'undefined') {{
+                new IntersectionObserver(entries => {{
+                    chartVisible = entries[entries.length - 1].isIntersecting;
+                    if (chartVisible && chartStale) scheduleChartRedraw();
+                }}).observe(canvas);
+            }}
+            window.addEventListener('resize', scheduleChartRedraw);
+            canvas.addEventListener('mousemove', showChartTooltip);
+            drawChart();
+        }}
+        
+        // Tick spacing of 1, 2 or 5 times a power of ten giving about five gridlines
+        function chartTickStep(max) {{
+            const raw = Math.max(max / 5, 1);
+            const magnitude = Math.pow(10, Math.floor(Math.log10(raw)));
+            const scaled = raw / magnitude;
+            return (scaled <= 1 ? 1 : scaled <= 2 ? 2 : scaled <= 5 ? 5 : 10) * magnitude;
+        }}
+        
+        function drawChart() {{
+            const {{canvas, ctx, labels, counts}} = dateChart;
+            const width = canvas.clientWidth;
+            const height = canvas.clientHeight;
+            const ratio = window.devicePixelRatio || 1;
+            canvas.width = Math.round(width * ratio);
+            canvas.height = Math.round(height * ratio);
+            ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+            ctx.clearRect(0, 0, width, height);
+            ctx.font = CHART_FONT;
+            
+            let max = 0;
+            for (let k = 0; k < counts.length; k++) {{
+                if (counts[k] > max) max = counts[k];
+            }}
+            const step = chartTickStep(max);
+            const top = Math.max(step, Math.ceil(max / step) * step);
+            const left = ctx.measureText(top.toLocaleString()).width + 14;
+            const plot = {{left, top: 8, right: width - 8, bottom: height - 24}};
+            const plotHeight = plot.bottom - plot.top;
+            const slot = (plot.right - plot.left) / Math.max(labels.length, 1);
+            dateChart.plot = {{...plot, slot}};
+            
+            // Gridlines and y tick labels
+            ctx.strokeStyle = CHART_GRID;
+            ctx.fillStyle = CHART_TEXT;
+            ctx.lineWidth = 1;
+            ctx.textAlign = 'right';
+            ctx.textBaseline = 'middle';
+            for (let value = 0; value <= top; value += step) {{
+                const y = Math.round(plot.bottom - value / top * plotHeight) + 0.5;
+                ctx.beginPath();
+                ctx.moveTo(plot.left, y);
+                ctx.lineTo(plot.right, y);
+                ctx.stroke();
+                ctx.fillText(value.toLocaleString(), plot.left - 6, y);
+            }}
+            
+            // Bars
+            ctx.fillStyle = CHART_BAR_FILL;
+            ctx.strokeStyle = CHART_BAR_BORDER;
+            const barWidth = Math.max(slot * 0.8, 1);
+            for (let k = 0; k < counts.length; k++) {{
+                const barHeight = counts[k] / top * plotHeight;
+                const x = plot.left + k * slot + (slot - barWidth) / 2;
+                ctx.fillRect(x, plot.bottom - barHeight, barWidth, barHeight);
+                ctx.strokeRect(x, plot.bottom - barHeight, barWidth, barHeight);
+            }}
+            
+            // Date labels, thinned out so they never overlap
+            ctx.fillStyle = CHART_TEXT;
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'top';
+            const labelWidth = labels.length ? ctx.measureText(String(labels[0])).width + 12 : 0;
+            const every = Math.max(1, Math.ceil(labelWidth / slot));
+            for (let k = 0; k < labels.length; k += every) {{
+                ctx.fillText(String(labels[k]), plot.left + (k + 0.5) * slot, plot.bottom + 6);
+            }}
+        }}
+        
+        // Hovering a bar shows its date and count as the canvas tooltip
+        function showChartTooltip(event) {{
+            const plot = dateChart.plot;
+            const rect = dateChart.canvas.getBoundingClientRect();
+            const k = plot ? Math.floor((event.clientX - rect.left - plot.left) / plot.slot) : -1;
+            dateChart.canvas.title = k >= 0 && k < dateChart.labels.length
+                ? `${{dateChart.labels[k]}}: ${{dateChart.counts[k].toLocaleString()}}`
+                : '';
         }}
         
-        function updateChart(data) {{
-            // Calculate new pivot data from filtered data
-            const dateCounts = {{}};
-            data.forEach(row => {{
-                const date = row.label_date;
-                dateCounts[date] = (dateCounts[date] || 0) + 1;
+        function sameCounts(a, b) {{
+            if (a === b) return true;
+            if (!a || !b || a.length !== b.length) return false;
+            for (let code = 0; code < a.length; code++) {{
+                if (a[code] !== b[code]) return false;
+            }}
+            return true;
+        }}
+        
+        // Redraw at most once per frame, and not while the chart is off-screen
+        function scheduleChartRedraw() {{
+            if (!chartVisible) {{
+                chartStale = true;
+                return;
+            }}
+            chartStale = false;
+            if (chartFrame !== null) return;
+            chartFrame = requestAnimationFrame(() => {{
+                chartFrame = null;
+                drawChart();
             }});
+        }}
+        
+        function updateChart(dateCounts) {{
+            // Nothing to redraw when the filter left every date's count as it was
+            if (sameCounts(dateCounts, chartCounts)) return;
+            chartCounts = dateCounts;
             
-            const sortedDates = Object.keys(dateCounts).sort();
-            const counts = sortedDates.map(d => dateCounts[d]);
+            // Per-date counts come from the filter pass, already in label order
+            const sortedDates = [];
+            const counts = [];
+            for (let code = 0; code < dateCounts.length; code++) {{
+                if (dateCounts[code] === 0) continue;
+                sortedDates.push(String(labelDateEnc.dict[code]));
+                counts.push(dateCounts[code]);
+            }}
             
             // Update chart data
-            dateChart.data.labels = sortedDates;
-            dateChart.data.datasets[0].data = counts;
-            dateChart.update();
+            dateChart.labels = sortedDates;
+            dateChart.counts = counts;
+            scheduleChartRedraw();
+        }}
+        
+        // Elements the filter, stats and table code touch on every pass, looked up once on init
+        const els = {{}};
+        
+        function cacheElements() {{
+            Object.assign(els, {{
+                search: document.getElementById('searchInput'),
+                source: document.getElementById('sourceFilter'),
+                status: document.getElementById('statusFilter'),
+                whseDept: document.getElementById('whseDeptFilter'),
+                area: document.getElementById('areaFilter'),
+                slot: document.getElementById('slotFilter'),
+                latestStatus: document.getElementById('latestStatusFilter'),
+                latestEventName: document.getElementById('latestEventNameFilter'),
+                date: document.getElementById('dateFilter'),
+                totalPicks: document.getElementById('total-picks'),
+                inhousePicks: document.getElementById('inhouse-picks'),
+                crossdockPicks: document.getElementById('crossdock-picks'),
+                oldestDate: document.getElementById('oldest-date'),
+                tableBody: document.getElementById('tableBody'),
+                showingStart: document.getElementById('showingStart'),
+                showingEnd: document.getElementById('showingEnd'),
+                totalRecords: document.getElementById('totalRecords'),
+                pageButtons: document.getElementById('pageButtons'),
+                pageSize: document.getElementById('pageSize')
+            }});
+        }}
+        
+        function filterDropdowns() {{
+            return [els.source, els.status, els.whseDept, els.area, els.slot, els.latestStatus, els.latestEventName, els.date];
         }}
         
         function initFilters() {{
-            // Helper function to populate a filter dropdown
-            function populateFilter(elementId, dataKey, allowBlank = false) {{
-                const filter = document.getElementById(elementId);
-                const uniqueValues = [...new Set(allData.map(d => d[dataKey]).filter(s => s && s !== ''))].sort();
-                uniqueValues.forEach(val => {{
-                    const option = document.createElement('option');
-                    option.value = val;
-                    option.textContent = val;
-                    filter.appendChild(option);
-                }});
+            // Filter options and initial stats are rendered server-side
+            // Add event listeners: typing is debounced, dropdown changes in the same tick share one pass
+            els.search.addEventListener('input', () => {{
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(scheduleFilters, SEARCH_DEBOUNCE_MS);
+            }});
+            for (const dropdown of filterDropdowns()) dropdown.addEventListener('change', scheduleFilters);
+        }}
+        
+        const SEARCH_DEBOUNCE_MS = 140;
+        let searchTimer = null;
+        let filtersPending = false;
+        
+        function scheduleFilters() {{
+            if (filtersPending) return;
+            filtersPending = true;
+            queueMicrotask(() => {{
+                filtersPending = false;
+                applyFilters();
+            }});
+        }}
+        
+        function updateStats(dateCounts) {{
+            // Calculate pick counts over the filtered rows
+            let inhousePicks = 0;
+            let crossdockPicks = 0;
+            for (let k = 0; k < filteredCount; k++) {{
+                const source = sourceTypeCol[filteredIdx[k]];
+                if (source === 'In House') inhousePicks++;
+                else if (source === 'CrossDock') crossdockPicks++;
             }}
             
-            // Populate all filters
-            populateFilter('dateFilter', 'label_date');
-            populateFilter('statusFilter', 'shipvoid_status');
-            populateFilter('whseDeptFilter', 'whse_dept');
-            populateFilter('areaFilter', 'area');
-            populateFilter('slotFilter', 'slot');
-            populateFilter('latestStatusFilter', 'latest_event_status');
-            populateFilter('latestEventNameFilter', 'latest_event_name');
-            
-            // Add event listeners
-            document.getElementById('searchInput').addEventListener('input', applyFilters);
-            document.getElementById('sourceFilter').addEventListener('change', applyFilters);
-            document.getElementById('statusFilter').addEventListener('change', applyFilters);
-            document.getElementById('whseDeptFilter').addEventListener('change', applyFilters);
-            document.getElementById('areaFilter').addEventListener('change', applyFilters);
-            document.getElementById('slotFilter').addEventListener('change', applyFilters);
-            document.getElementById('latestStatusFilter').addEventListener('change', applyFilters);
-            document.getElementById('latestEventNameFilter').addEventListener('change', applyFilters);
-            document.getElementById('dateFilter').addEventListener('change', applyFilters);
-        }}
-        
-        function updateStats(data) {{
-            // Use provided data (filtered) or default to all data
-            const targetData = data || allData;
-            
-            // Calculate pick counts
-            const totalPicks = targetData.length;
-            const inhousePicks = targetData.filter(d => d.source_type === 'In House').length;
-            const crossdockPicks = targetData.filter(d => d.source_type === 'CrossDock').length;
-            
-            document.getElementById('total-picks').textContent = totalPicks.toLocaleString();
-            document.getElementById('inhouse-picks').textContent = inhousePicks.toLocaleString();
-            document.getElementById('crossdock-picks').textContent = crossdockPicks.toLocaleString();
+            // The label date dictionary is sorted, so the oldest date is the first
+            // non-blank one the filter pass counted any rows for
+            let oldestDate = null;
+            for (let code = 0; code < dateCounts.length && oldestDate === null; code++) {{
+                const date = labelDateEnc.dict[code];
+                if (dateCounts[code] && date) oldestDate = String(date);
+            }}
             
-            // Update oldest date
-            const dates = targetData.map(d => d.label_date).filter(d => d && d !== '');
-            const oldestDate = dates.length > 0 ? dates.sort()[0] : 'N/A';
-            document.getElementById('oldest-date').textContent = oldestDate;
+            els.totalPicks.textContent = filteredCount.toLocaleString();
+            els.inhousePicks.textContent = inhousePicks.toLocaleString();
+            els.crossdockPicks.textContent = crossdockPicks.toLocaleString();
+            els.oldestDate.textContent = oldestDate === null ? 'N/A' : oldestDate;
         }}
         
         function applyFilters() {{
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const sourceFilter = document.getElementById('sourceFilter').value;
-            const statusFilter = document.getElementById('statusFilter').value;
-            const whseDeptFilter = document.getElementById('whseDeptFilter').value;
-            const areaFilter = document.getElementById('areaFilter').value;
-            const slotFilter = document.getElementById('slotFilter').value;
-            const latestStatusFilter = document.getElementById('latestStatusFilter').value;
-            const latestEventNameFilter = document.getElementById('latestEventNameFilter').value;
-            const dateFilter = document.getElementById('dateFilter').value;
+            const query = {{
+                searchTerm: els.search.value.toLowerCase(),
+                source: filterCode(sourceTypeEnc, els.source.value),
+                status: filterCode(shipvoidStatusEnc, els.status.value),
+                whseDept: filterCode(whseDeptEnc, els.whseDept.value),
+                area: filterCode(areaEnc, els.area.value),
+                slot: filterCode(slotEnc, els.slot.value),
+                latestStatus: filterCode(latestEventStatusEnc, els.latestStatus.value, true),
+                latestEventName: filterCode(latestEventNameEnc, els.latestEventName.value, true),
+                date: filterCode(labelDateEnc, els.date.value)
+            }};
             
-            filteredData = allData.filter(row => {{
-                // Search filter
-                if (searchTerm) {{
-                    const searchable = Object.values(row).join(' ').toLowerCase();
-                    if (!searchable.includes(searchTerm)) return false;
-                }}
-                
-                // Source filter (In House / CrossDock)
-                if (sourceFilter && row.source_type !== sourceFilter) return false;
-                
-                // Shipvoid Status filter
-                if (statusFilter && row.shipvoid_status !== statusFilter) return false;
-                
-                // Whse Dept filter
-                if (whseDeptFilter && row.whse_dept !== whseDeptFilter) return false;
-                
-                // Area filter
-                if (areaFilter && row.area !== areaFilter) return false;
-                
-                // Slot filter
-                if (slotFilter && row.slot !== slotFilter) return false;
-                
-                // Atlas Status filter
-                if (latestStatusFilter) {{
-                    if (latestStatusFilter === '__BLANK__') {{
-                        // Filter for blank/empty latest status (not found in Legacy report)
-                        if (row.latest_event_status && row.latest_event_status !== '') return false;
-                    }} else {{
-                        if (row.latest_event_status !== latestStatusFilter) return false;
-                    }}
-                }}
-                
-                // Latest Event Name filter
-                if (latestEventNameFilter) {{
-                    if (latestEventNameFilter === '__BLANK__') {{
-                        // Filter for blank/empty event name (not found in Legacy report)
-                        if (row.latest_event_name && row.latest_event_name !== '') return false;
-                    }} else {{
-                        if (row.latest_event_name !== latestEventNameFilter) return false;
-                    }}
-                }}
-                
-                // Date filter
-                if (dateFilter && row.label_date !== dateFilter) return false;
-                
-                return true;
+            const key = JSON.stringify(query);
+            return enqueue(() => {{
+                const cached = cachedFilter(key);
+                if (cached) return cached;
+                const scan = lastFilter && isStricter(query, lastFilter.query) ? lastFilter.idx.slice(0, lastFilter.count) : null;
+                return postJob({{type: 'filter', query, scan}}).then(result => {{
+                    rememberFilter(key, result);
+                    return result;
+                }});
+            }}).then(result => {{
+                lastFilter = {{query, idx: result.idx, count: result.count}};
+                filteredIdx = result.idx;
+                filteredCount = result.count;
+                currentPage = 1;
+                updateStats(result.dateCounts);
+                updateChart(result.dateCounts);
+                renderTable();
             }});
-            
-            currentPage = 1;
-            updateStats(filteredData);
-            updateChart(filteredData);
-            renderTable();
+        }}
+        
+        // True when every row query matches also matches previous: the search term
+        // only grew and each dropdown either stayed put or went from "All" to a value
+        function isStricter(query, previous) {{
+            if (!query.searchTerm.includes(previous.searchTerm)) return false;
+            return Object.keys(query).every(key => key === 'searchTerm' || previous[key] === NO_FILTER || previous[key] === query[key]);
         }}
         
         function sortTable(column) {{
@@ -960,78 +1671,151 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
                 sortDirection = 'asc';
             }}
             
-            filteredData.sort((a, b) => {{
-                let valA = a[column] || '';
-                let valB = b[column] || '';
-                
-                if (typeof valA === 'string') valA = valA.toLowerCase();
-                if (typeof valB === 'string') valB = valB.toLowerCase();
-                
-                if (valA < valB) return sortDirection === 'asc' ? -1 : 1;
-                if (valA > valB) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
-            }});
-            
-            renderTable();
+            const direction = sortDirection;
+            return enqueue(() => postJob({{type: 'sort', idx: filteredIdx.slice(0, filteredCount), count: filteredCount, column, direction}}).then(result => {{
+                filteredIdx = result.idx;
+                filteredCount = result.count;
+                renderTable();
+            }}));
+        }}
+        
+        // Table rows are created once and reused: rendering rewrites cell text and badge
+        // classes instead of reparsing the page's HTML
+        const rowPool = [];
+        const CELLS_PER_ROW = 14;
+        const BADGE_CELLS = [1, 8, 11];
+        
+        function makeRow() {{
+            const tr = document.createElement('tr');
+            const cells = [];
+            for (let c = 0; c < CELLS_PER_ROW; c++) {{
+                const td = document.createElement('td');
+                if (BADGE_CELLS.includes(c)) td.appendChild(document.createElement('span'));
+                tr.appendChild(td);
+                cells.push(BADGE_CELLS.includes(c) ? td.firstChild : td);
+            }}
+            return {{tr, cells}};
+        }}
+        
+        function growRowPool(tbody, size) {{
+            if (rowPool.length === 0) tbody.textContent = '';
+            const fragment = document.createDocumentFragment();
+            while (rowPool.length < size) {{
+                const row = makeRow();
+                rowPool.push(row);
+                fragment.appendChild(row.tr);
+            }}
+            tbody.appendChild(fragment);
+        }}
+        
+        function fillRow(row, i) {{
+            const cells = row.cells;
+            cells[0].textContent = `${{containerIdCol[i]}}`;
+            cells[1].className = `source-badge source-${{(sourceTypeCol[i] || '').replace(' ', '')}}`;
+            cells[1].textContent = sourceTypeCol[i] || '-';
+            cells[2].textContent = `${{itemCol[i]}}`;
+            cells[3].textContent = itemDescriptionCol[i] || '-';
+            cells[4].textContent = `${{poCol[i]}}`;
+            cells[5].textContent = whseDeptCol[i] || '-';
+            cells[6].textContent = areaCol[i] || '-';
+            cells[7].textContent = slotCol[i] || '-';
+            cells[8].className = `status-badge status-${{shipvoidStatusCol[i] || 'default'}}`;
+            cells[8].textContent = shipvoidStatusCol[i] || '-';
+            cells[9].textContent = latestEventTsCol[i] || '-';
+            cells[10].textContent = latestEventNameCol[i] || '-';
+            cells[11].className = `status-badge status-${{latestEventStatusCol[i] || 'default'}}`;
+            cells[11].textContent = latestEventStatusCol[i] || '-';
+            cells[12].textContent = atlasLocationCol[i] || '-';
+            cells[13].textContent = `${{labelDateCol[i]}}`;
         }}
         
         function renderTable() {{
-            const tbody = document.getElementById('tableBody');
+            const tbody = els.tableBody;
             const start = (currentPage - 1) * pageSize;
-            const end = Math.min(start + pageSize, filteredData.length);
-            const pageData = filteredData.slice(start, end);
+            const end = Math.min(start + pageSize, filteredCount);
             
-            tbody.innerHTML = pageData.map(row => `
-                <tr>
-                    <td>${{row.container_id}}</td>
-                    <td><span class="source-badge source-${{(row.source_type || '').replace(' ', '')}}">${{row.source_type || '-'}}</span></td>
-                    <td>${{row.item}}</td>
-                    <td>${{row.item_description || '-'}}</td>
-                    <td>${{row.po}}</td>
-                    <td>${{row.whse_dept || '-'}}</td>
-                    <td>${{row.area || '-'}}</td>
-                    <td>${{row.slot || '-'}}</td>
-                    <td><span class="status-badge status-${{row.shipvoid_status || 'default'}}">${{row.shipvoid_status || '-'}}</span></td>
-                    <td>${{row.latest_event_ts || '-'}}</td>
-                    <td>${{row.latest_event_name || '-'}}</td>
-                    <td><span class="status-badge status-${{row.latest_event_status || 'default'}}">${{row.latest_event_status || '-'}}</span></td>
-                    <td>${{row.atlas_location || '-'}}</td>
-                    <td>${{row.label_date}}</td>
-                </tr>
-            `).join('');
+            growRowPool(tbody, end - start);
+            for (let r = 0; r < rowPool.length; r++) {{
+                const row = rowPool[r];
+                if (start + r < end) {{
+                    fillRow(row, filteredIdx[start + r]);
+                    row.tr.style.display = '';
+                }} else {{
+                    row.tr.style.display = 'none';
+                }}
+            }}
             
             // Update pagination info
-            document.getElementById('showingStart').textContent = filteredData.length > 0 ? start + 1 : 0;
-            document.getElementById('showingEnd').textContent = end;
-            document.getElementById('totalRecords').textContent = filteredData.length.toLocaleString();
+            els.showingStart.textContent = filteredCount > 0 ? start + 1 : 0;
+            els.showingEnd.textContent = end;
+            els.totalRecords.textContent = filteredCount.toLocaleString();
             
             renderPagination();
         }}
         
+        // Pagination reuses one set of buttons: first, prev, up to five page numbers, next, last
+        const PAGE_WINDOW = 5;
+        let pageButtonSet = null;
+        
+        function makePageButton(label) {{
+            const button = document.createElement('button');
+            button.className = 'page-btn';
+            button.textContent = label;
+            button.addEventListener('click', () => goToPage(Number(button.dataset.page)));
+            return button;
+        }}
+        
+        function buildPageButtons() {{
+            const numbers = Array.from({{length: PAGE_WINDOW}}, () => makePageButton(''));
+            pageButtonSet = {{
+                first: makePageButton('\u00ab'),
+                prev: makePageButton('\u2039'),
+                numbers,
+                next: makePageButton('\u203a'),
+                last: makePageButton('\u00bb')
+            }};
+            const fragment = document.createDocumentFragment();
+            for (const button of [pageButtonSet.first, pageButtonSet.prev, ...numbers, pageButtonSet.next, pageButtonSet.last]) {{
+                fragment.appendChild(button);
+            }}
+            els.pageButtons.textContent = '';
+            els.pageButtons.appendChild(fragment);
+        }}
+        
         function renderPagination() {{
-            const totalPages = Math.ceil(filteredData.length / pageSize);
-            const pageButtons = document.getElementById('pageButtons');
+            const totalPages = Math.ceil(filteredCount / pageSize);
+            if (!pageButtonSet) buildPageButtons();
+            const {{first, prev, numbers, next, last}} = pageButtonSet;
             
-            let html = '';
-            html += `<button class="page-btn" onclick="goToPage(1)" ${{currentPage === 1 ? 'disabled' : ''}}>&laquo;</button>`;
-            html += `<button class="page-btn" onclick="goToPage(${{currentPage - 1}})" ${{currentPage === 1 ? 'disabled' : ''}}>&lsaquo;</button>`;
+            first.dataset.page = 1;
+            first.disabled = currentPage === 1;
+            prev.dataset.page = currentPage - 1;
+            prev.disabled = currentPage === 1;
             
             // Show limited page numbers
             let startPage = Math.max(1, currentPage - 2);
             let endPage = Math.min(totalPages, currentPage + 2);
             
-            for (let i = startPage; i <= endPage; i++) {{
-                html += `<button class="page-btn ${{i === currentPage ? 'active' : ''}}" onclick="goToPage(${{i}})">${{i}}</button>`;
-            }}
-            
-            html += `<button class="page-btn" onclick="goToPage(${{currentPage + 1}})" ${{currentPage === totalPages ? 'disabled' : ''}}>&rsaquo;</button>`;
-            html += `<button class="page-btn" onclick="goToPage(${{totalPages}})" ${{currentPage === totalPages ? 'disabled' : ''}}>&raquo;</button>`;
+            numbers.forEach((button, k) => {{
+                const page = startPage + k;
+                if (page > endPage) {{
+                    button.style.display = 'none';
+                    return;
+                }}
+                button.style.display = '';
+                button.dataset.page = page;
+                button.textContent = page;
+                button.classList.toggle('active', page === currentPage);
+            }});
             
-            pageButtons.innerHTML = html;
+            next.dataset.page = currentPage + 1;
+            next.disabled = currentPage === totalPages;
+            last.dataset.page = totalPages;
+            last.disabled = currentPage === totalPages;
         }}
         
         function goToPage(page) {{
-            const totalPages = Math.ceil(filteredData.length / pageSize);
+            const totalPages = Math.ceil(filteredCount / pageSize);
             if (page >= 1 && page <= totalPages) {{
                 currentPage = page;
                 renderTable();
@@ -1039,54 +1823,80 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
         }}
         
         function changePageSize() {{
-            pageSize = parseInt(document.getElementById('pageSize').value);
+            pageSize = parseInt(els.pageSize.value);
             currentPage = 1;
             renderTable();
         }}
         
         function resetFilters() {{
-            document.getElementById('searchInput').value = '';
-            document.getElementById('sourceFilter').value = '';
-            document.getElementById('statusFilter').value = '';
-            document.getElementById('whseDeptFilter').value = '';
-            document.getElementById('areaFilter').value = '';
-            document.getElementById('slotFilter').value = '';
-            document.getElementById('latestStatusFilter').value = '';
-            document.getElementById('latestEventNameFilter').value = '';
-            document.getElementById('dateFilter').value = '';
-            filteredData = [...allData];
-            currentPage = 1;
+            clearTimeout(searchTimer);
+            els.search.value = '';
+            for (const dropdown of filterDropdowns()) dropdown.value = '';
             sortColumn = null;
-            updateStats(allData);
-            updateChart(allData);
-            renderTable();
+            return enqueue(() => {{
+                lastFilter = null;
+                selectAllRows();
+                currentPage = 1;
+                updateStats(allDateCounts);
+                updateChart(allDateCounts);
+                renderTable();
+            }});
+        }}
+        
+        const CSV_CHUNK_ROWS = 8192;
+        
+        // Whether a cell needs quoting: it holds a quote, comma, or line break
+        function csvNeedsQuotes(text) {{
+            for (let j = 0; j < text.length; j++) {{
+                const c = text.charCodeAt(j);
+                if (c === 34 || c === 44 || c === 10 || c === 13) return true;
+            }}
+            return false;
+        }}
+        
+        function csvCell(value) {{
+            const text = value ? String(value) : '';
+            return csvNeedsQuotes(text) ? '"' + text.replace(/"/g, '""') + '"' : text;
+        }}
+        
+        // Columns with no cell that needs quoting are written raw, checked once per column
+        const csvSafeColumns = new Map();
+        
+        function csvColumnIsSafe(col) {{
+            if (!csvSafeColumns.has(col)) {{
+                let safe = true;
+                for (let i = 0; i < rowCount && safe; i++) {{
+                    if (col[i] && csvNeedsQuotes(String(col[i]))) safe = false;
+                }}
+                csvSafeColumns.set(col, safe);
+            }}
+            return csvSafeColumns.get(col);
         }}
         
         function exportToCSV() {{
             const headers = ['Container ID', 'Source', 'Item', 'Item Description', 'PO', 'Whse Dept', 'Area', 'Slot', 'Legacy Cartons', 'Latest Event Time', 'Latest Event Name', 'Atlas Status', 'Atlas Location', 'Label Date'];
-            const rows = filteredData.map(row => [
-                row.container_id,
-                row.source_type,
-                row.item,
-                row.item_description,
-                row.po,
-                row.whse_dept,
-                row.area,
-                row.slot,
-                row.shipvoid_status,
-                row.latest_event_ts,
-                row.latest_event_name,
-                row.latest_event_status,
-                row.atlas_location,
-                row.label_date
-            ]);
+            const exportCols = [
+                containerIdCol, sourceTypeCol, itemCol, itemDescriptionCol, poCol, whseDeptCol, areaCol,
+                slotCol, shipvoidStatusCol, latestEventTsCol, latestEventNameCol, latestEventStatusCol,
+                atlasLocationCol, labelDateCol
+            ];
             
-            let csvContent = headers.join(',') + '\\n';
-            rows.forEach(row => {{
-                csvContent += row.map(cell => `"${{cell || ''}}"`).join(',') + '\\n';
-            }});
+            const writers = exportCols.map(col => csvColumnIsSafe(col) ? (i => col[i] ? String(col[i]) : '') : (i => csvCell(col[i])));
             
-            const blob = new Blob([csvContent], {{ type: 'text/csv;charset=utf-8;' }});
+            // Rows are joined a chunk at a time and handed to the Blob as separate parts,
+            // so no single string ever holds the whole export
+            const chunks = [headers.join(',') + '\\n'];
+            for (let chunkStart = 0; chunkStart < filteredCount; chunkStart += CSV_CHUNK_ROWS) {{
+                const chunkEnd = Math.min(chunkStart + CSV_CHUNK_ROWS, filteredCount);
+                const lines = [];
+                for (let k = chunkStart; k < chunkEnd; k++) {{
+                    const i = filteredIdx[k];
+                    lines.push(writers.map(write => write(i)).join(','));
+                }}
+                chunks.push(lines.join('\\n') + '\\n');
+            }}
+            
+            const blob = new Blob(chunks, {{ type: 'text/csv;charset=utf-8;' }});
             const link = document.createElement('a');
             link.href = URL.createObjectURL(blob);
             link.download = 'shipvoid_report_' + new Date().toISOString().slice(0,10) + '.csv';
@@ -1095,7 +1905,9 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
         
         function copyContainerIds() {{
             // Get all unique container IDs from filtered data
-            const containerIds = [...new Set(filteredData.map(row => row.container_id))].filter(id => id && id !== '');
+            const ids = new Set();
+            for (let k = 0; k < filteredCount; k++) ids.add(containerIdCol[filteredIdx[k]]);
+            const containerIds = [...ids].filter(id => id && id !== '');
             
             if (containerIds.length === 0) {{
                 showToast('No container IDs to copy!', 'warning');
@@ -1131,6 +1943,23 @@ def generate_html_report(df: pd.DataFrame, pivot_data: dict, output_path: str):
                 toast.classList.remove('show');
             }}, 3000);
         }}
+        
+        // Module scope: expose the handlers the page's inline attributes call
+        Object.assign(window, {{sortTable, changePageSize, resetFilters, exportToCSV, copyContainerIds}});
+        
+        // Initialize; the module may only finish decoding after the DOM is ready
+        function init() {{
+            cacheElements();
+            startWorker();
+            initChart();
+            initFilters();
+            renderTable();
+        }}
+        if (document.readyState === 'loading') {{
+            document.addEventListener('DOMContentLoaded', init);
+        }} else {{
+            init();
+        }}
     </script>
 </body>
 </html>'''
@@ -1218,12 +2047,8 @@ def main(skip_download: bool = False):
     print(f"  Found Legacy file: {legacy_file}")
     print()
     
-    # Load data
-    shipvoid_df = load_shipvoid_forecast(shipvoid_file)
-    legacy_df = load_legacy_unbilled(legacy_file)
-    
-    # Merge data
-    merged_df = merge_data(shipvoid_df, legacy_df)
+    # Load and merge data (skipped when the Parquet cache is current)
+    merged_df = load_merged_data(shipvoid_file, legacy_file)
     
     # Generate pivot data
     pivot_data = generate_pivot_data(merged_df)
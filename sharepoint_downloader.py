@@ -7,15 +7,36 @@ from the SharePoint/Teams folder for DC 6031.
 
 Dependencies:
     uv pip install msal requests --index-url https://pypi.ci.artifacts.walmart.com/artifactory/api/pypi/external-pypi/simple --allow-insecure-host pypi.ci.artifacts.walmart.com
+
+    Optional: msal-extensions keeps the token cache encrypted with the OS
+    credential store (DPAPI / Keychain / libsecret) instead of plain JSON.
 """
 
 import fnmatch
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote
 
 import msal
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import msal_extensions
+except ImportError:  # fall back to the plain JSON token cache
+    msal_extensions = None
+
+try:
+    import orjson
+except ImportError:  # the downloader only needs msal and requests
+    orjson = None
 
 
 # SharePoint Site Configuration for DC 6031
@@ -32,6 +53,83 @@ CLIENT_ID = "04b07795-8ddb-461a-bbee-02f9e1bf7b46"  # Azure CLI public client ID
 SHIPVOID_PATTERN = "Shipvoid*.xlsm"  # Excel format with Inhouse and Crossdock sheets
 LEGACY_PATTERN = "Legacy*.csv"
 
+# Graph accepts at most 20 sub-requests per $batch call
+BATCH_MAX_REQUESTS = 20
+# Newest children fetched per pattern in a batched lookup before falling back to a full listing
+BATCH_PAGE_SIZE = 50
+# DriveItem fields the lookups and downloads use; Graph omits everything else
+ITEM_SELECT = "id,name,lastModifiedDateTime,size,eTag,file,@microsoft.graph.downloadUrl"
+# Downloads are fetched as parallel byte ranges of this size
+DOWNLOAD_SHARD_SIZE = 8 * 1024 * 1024
+DOWNLOAD_WORKERS = 8
+# Bytes moved from the socket to disk per read/write
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# Progress is printed at most this many times per download
+PROGRESS_UPDATES = 20
+# Connections kept open per host by each session; enough for every download worker
+SESSION_POOL_SIZE = 16
+# Glob patterns of the form "<prefix>*<suffix>", which Graph can filter on server-side
+_PREFIX_SUFFIX_PATTERN = re.compile(r"^([^*?\[\]]*)\*([^*?\[\]]*)$")
+
+
+def pattern_prefix_ext(pattern: str) -> Optional[tuple[str, str]]:
+    """Split a "<prefix>*<ext>" glob such as SHIPVOID_PATTERN into (prefix, ext)."""
+    match = _PREFIX_SUFFIX_PATTERN.match(pattern)
+    return (match.group(1), match.group(2)) if match else None
+
+
+@lru_cache(maxsize=None)
+def _glob_regex(pattern: str) -> re.Pattern:
+    """Compiled regex for a glob, matching case-insensitively where fnmatch.fnmatch does (Windows)."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def _odata_string(value: str) -> str:
+    """Quote a value as an OData string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _pooled_session() -> requests.Session:
+    """Session whose HTTPS connections (and TLS sessions) are reused across requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=SESSION_POOL_SIZE, pool_maxsize=SESSION_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _preallocate(f, size: int) -> None:
+    """Reserve size bytes of disk for f up front, where the platform supports it."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # Filesystem can't preallocate; the file just grows as it is written
+
+
+def _progress_step(total_size: int) -> int:
+    """Bytes to download between progress prints."""
+    return max(total_size // PROGRESS_UPDATES, DOWNLOAD_BUFFER_SIZE)
+
+
+def _print_progress(filename: str, downloaded: int, total_size: int) -> None:
+    """Print a progress line naming its file, since several downloads can run at once."""
+    print(f"  {filename}: {downloaded / total_size * 100:.1f}%", flush=True)
+
+
+def _json(response: requests.Response):
+    """Parse a Graph JSON response, with orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _content_range_total(response: requests.Response) -> Optional[int]:
+    """Total size from a 206 response's Content-Range header (bytes a-b/total)."""
+    total = response.headers.get("content-range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
 
 class SharePointDownloader:
     """Downloads files from SharePoint/Teams using Microsoft Graph API."""
@@ -51,21 +149,83 @@ class SharePointDownloader:
         self.access_token: Optional[str] = None
         self.graph_base_url = "https://graph.microsoft.com/v1.0"
         self.token_cache_file = Path.home() / ".sharepoint_token_cache.json"
+        # Encrypted cache used instead when msal-extensions is installed
+        self.encrypted_token_cache_file = Path.home() / ".sharepoint_token_cache.bin"
+        # MSAL app built from the token cache file, reused until the file changes on disk
+        self._msal_app: Optional[tuple] = None
+        self._cache_mtime: Optional[float] = None
+        self._cache_persisted = False
+        # Graph calls and pre-signed download URLs live on different hosts
+        self._session = _pooled_session()
+        self._download_session = _pooled_session()
+        # Folder listings already fetched this session, by folder path
+        self._listing_cache: dict[str, list[dict]] = {}
+    
+    def clear_listing_cache(self) -> None:
+        """Forget cached folder listings so the next lookup sees the folder's current contents."""
+        self._listing_cache.clear()
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
+        self._download_session.close()
+    
+    def __enter__(self) -> "SharePointDownloader":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _get_msal_app(self) -> tuple:
         """Create MSAL public client application with token cache."""
+        if self._msal_app is None and msal_extensions is not None:
+            cache = self._persisted_token_cache()
+            if cache is not None:
+                self._msal_app = (self._build_msal_app(cache), cache)
+                self._cache_persisted = True
+        if self._cache_persisted:
+            # msal-extensions reloads and saves the cache itself as it changes
+            return self._msal_app
+        
+        try:
+            mtime = self.token_cache_file.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if self._msal_app is not None and mtime == self._cache_mtime:
+            return self._msal_app
+        
         cache = msal.SerializableTokenCache()
         
-        if self.token_cache_file.exists():
+        if mtime is not None:
             cache.deserialize(self.token_cache_file.read_text())
         
-        app = msal.PublicClientApplication(
+        self._msal_app = (self._build_msal_app(cache), cache)
+        self._cache_mtime = mtime
+        return self._msal_app
+    
+    def _build_msal_app(self, cache: msal.TokenCache) -> msal.PublicClientApplication:
+        """MSAL public client application backed by cache."""
+        return msal.PublicClientApplication(
             self.client_id,
             authority=f"https://login.microsoftonline.com/{self.tenant_id}",
             token_cache=cache
         )
-        
-        return app, cache
+    
+    def _persisted_token_cache(self) -> Optional[msal.TokenCache]:
+        """OS-encrypted token cache from msal-extensions, or None if this platform has no store."""
+        try:
+            persistence = msal_extensions.build_encrypted_persistence(str(self.encrypted_token_cache_file))
+        except Exception as e:  # e.g. no libsecret/keyring on a headless Linux box
+            print(f"[WARN] Encrypted token cache unavailable ({e}); using {self.token_cache_file.name}")
+            return None
+        return msal_extensions.PersistedTokenCache(persistence)
+    
+    def _save_token_cache(self, cache: msal.SerializableTokenCache) -> None:
+        """Write the token cache atomically so concurrent runs never read half a file."""
+        tmp_path = self.token_cache_file.with_name(self.token_cache_file.name + ".tmp")
+        tmp_path.write_text(cache.serialize())
+        os.replace(tmp_path, self.token_cache_file)
+        self._cache_mtime = self.token_cache_file.stat().st_mtime
     
     def authenticate(self, force_refresh: bool = False) -> str:
         """Authenticate with Microsoft Graph using device code flow."""
@@ -95,14 +255,17 @@ class SharePointDownloader:
             raise Exception(f"Authentication failed: {result.get('error_description', 'Unknown error')}")
         
         self.access_token = result["access_token"]
+        # A new sign-in may see a different view of the drive
+        self.clear_listing_cache()
         
-        if cache.has_state_changed:
-            self.token_cache_file.write_text(cache.serialize())
+        # msal-extensions has already saved to the encrypted store; never write plaintext then
+        if cache.has_state_changed and not self._cache_persisted:
+            self._save_token_cache(cache)
         
         print("[OK] Authentication successful!")
         return self.access_token
     
-    def _make_request(self, endpoint: str, **kwargs) -> requests.Response:
+    def _make_request(self, endpoint: str, method: str = "GET", **kwargs) -> requests.Response:
         """Make an authenticated request to Microsoft Graph."""
         if not self.access_token:
             self.authenticate()
@@ -113,50 +276,117 @@ class SharePointDownloader:
         }
         
         url = f"{self.graph_base_url}{endpoint}" if endpoint.startswith("/") else endpoint
-        response = requests.get(url, headers=headers, **kwargs)
+        response = self._session.request(method, url, headers=headers, **kwargs)
         
         # Handle token expiration
         if response.status_code == 401:
             print("[WARN] Token expired, re-authenticating...")
             self.authenticate(force_refresh=True)
             headers["Authorization"] = f"Bearer {self.access_token}"
-            response = requests.get(url, headers=headers, **kwargs)
+            response = self._session.request(method, url, headers=headers, **kwargs)
         
         return response
     
-    def list_folder_contents(self, folder_path: str) -> list[dict]:
-        """List all items in a SharePoint folder."""
+    def _children_endpoint(self, folder_path: str) -> str:
+        """Graph endpoint listing the children of a folder in the drive."""
         encoded_path = folder_path.replace("/", ":/").lstrip(":")
         if encoded_path:
-            endpoint = f"/drives/{self.drive_id}/root:/{encoded_path}:/children"
-        else:
-            endpoint = f"/drives/{self.drive_id}/root/children"
+            return f"/drives/{self.drive_id}/root:/{encoded_path}:/children"
+        return f"/drives/{self.drive_id}/root/children"
+    
+    def list_folder_contents(self, folder_path: str) -> list[dict]:
+        """List all items in a SharePoint folder (fetched once per downloader)."""
+        cached = self._listing_cache.get(folder_path)
+        if cached is not None:
+            return cached
         
         items = []
-        next_link = endpoint
+        next_link = f"{self._children_endpoint(folder_path)}?$select={ITEM_SELECT}"
         
         while next_link:
             response = self._make_request(next_link)
             response.raise_for_status()
-            data = response.json()
+            data = _json(response)
             items.extend(data.get("value", []))
             next_link = data.get("@odata.nextLink")
         
+        self._listing_cache[folder_path] = items
         return items
     
     def find_newest_file(self, folder_path: str, pattern: str) -> Optional[dict]:
         """Find the newest file matching a pattern in the folder."""
-        items = self.list_folder_contents(folder_path)
-        files = [item for item in items if "file" in item]
+        return self._newest_matching(self.list_folder_contents(folder_path), pattern)
+    
+    def _newest_query(self, folder_path: str, name_prefix: str, ext: str) -> str:
+        """Children query returning only the newest file named <name_prefix>...<ext>."""
+        endpoint = quote(self._children_endpoint(folder_path), safe="/:!")
+        name_filter = f"startswith(name,{_odata_string(name_prefix)}) and endswith(name,{_odata_string(ext)})"
+        return (
+            f"{endpoint}?$filter={quote(name_filter, safe='(),')}"
+            f"&$orderby=lastModifiedDateTime%20desc&$top=1&$select={ITEM_SELECT}"
+        )
+    
+    def _newest_children_url(self, folder_path: str, pattern: str) -> str:
+        """Batch sub-request URL for the newest children a pattern can match, newest first."""
+        prefix_ext = pattern_prefix_ext(pattern)
+        if prefix_ext:
+            return self._newest_query(folder_path, *prefix_ext)
+        endpoint = quote(self._children_endpoint(folder_path), safe="/:!")
+        return f"{endpoint}?$orderby=lastModifiedDateTime%20desc&$top={BATCH_PAGE_SIZE}&$select={ITEM_SELECT}"
+    
+    def batch_find_newest(self, folder_path: str, patterns: list[str]) -> dict[str, Optional[dict]]:
+        """
+        Find the newest file for each pattern with one Graph $batch call.
         
-        matching = [f for f in files if fnmatch.fnmatch(f["name"], pattern)]
+        "<prefix>*<ext>" patterns are filtered and sorted server-side down to one item;
+        other patterns share a page of the folder's newest children. Either way the
+        result is checked client-side. A pattern whose sub-request fails (e.g. Graph
+        rejecting the filter with a 400), or whose page holds no match while more
+        children remain, falls back to find_newest_file.
+        """
+        urls: dict[str, list[str]] = {}
+        for pattern in patterns:
+            urls.setdefault(self._newest_children_url(folder_path, pattern), []).append(pattern)
+        
+        results: dict[str, Optional[dict]] = {}
+        batched = list(urls.items())
+        for start in range(0, len(batched), BATCH_MAX_REQUESTS):
+            group = batched[start:start + BATCH_MAX_REQUESTS]
+            body = {
+                "requests": [
+                    {"id": str(i), "method": "GET", "url": url, "headers": {"ConsistencyLevel": "eventual"}}
+                    for i, (url, _) in enumerate(group)
+                ]
+            }
+            response = self._make_request("/$batch", method="POST", json=body)
+            response.raise_for_status()
+            
+            for sub_response in _json(response).get("responses", []):
+                _, group_patterns = group[int(sub_response["id"])]
+                page = sub_response.get("body") or {}
+                for pattern in group_patterns:
+                    if sub_response.get("status") != 200:
+                        results[pattern] = self.find_newest_file(folder_path, pattern)
+                        continue
+                    newest = self._newest_matching(page.get("value", []), pattern)
+                    if newest is None and page.get("@odata.nextLink"):
+                        newest = self.find_newest_file(folder_path, pattern)
+                    results[pattern] = newest
         
+        # Anything the batch response left out gets looked up on its own
+        for pattern in patterns:
+            if pattern not in results:
+                results[pattern] = self.find_newest_file(folder_path, pattern)
+        return results
+    
+    @staticmethod
+    def _newest_matching(items: list[dict], pattern: str) -> Optional[dict]:
+        """Newest file among items whose name matches pattern."""
+        regex = _glob_regex(pattern)
+        matching = [item for item in items if "file" in item and regex.match(item["name"])]
         if not matching:
             return None
-        
-        # Sort by lastModifiedDateTime descending
-        matching.sort(key=lambda x: x.get("lastModifiedDateTime", ""), reverse=True)
-        return matching[0]
+        return max(matching, key=lambda x: x.get("lastModifiedDateTime", ""))
     
     def download_file(self, file_item: dict, destination_dir: Path, filename: Optional[str] = None) -> Path:
         """Download a file from SharePoint."""
@@ -166,36 +396,153 @@ class SharePointDownloader:
         filename = filename or file_item["name"]
         destination_path = destination_dir / filename
         
+        # The sidecar holds the eTag of the version last saved to destination_path
+        etag = file_item.get("eTag")
+        etag_path = destination_path.with_name(destination_path.name + ".etag")
+        if etag and destination_path.exists() and etag_path.exists() and etag_path.read_text() == etag:
+            print(f"[SKIP] {filename} is already up to date")
+            return destination_path
+        
         download_url = file_item.get("@microsoft.graph.downloadUrl")
         
-        if not download_url:
-            item_id = file_item["id"]
-            response = self._make_request(f"/drives/{self.drive_id}/items/{item_id}")
-            response.raise_for_status()
-            item_data = response.json()
-            download_url = item_data.get("@microsoft.graph.downloadUrl")
+        print(f"[DOWNLOAD] Downloading {filename}...")
         
-        if not download_url:
-            raise Exception(f"Could not get download URL for {filename}")
+        # Probe with a one-byte range: a 206 carries the total size, while a 200 means
+        # the server ignores ranges and is already sending the whole file
+        probe_headers = {"Range": "bytes=0-0"}
+        if download_url:
+            response = self._download_session.get(download_url, headers=probe_headers, stream=True)
+        else:
+            # The item's /content endpoint redirects to its pre-signed download URL, so the
+            # probe itself resolves the URL; requests drops the Authorization header on the
+            # cross-host redirect
+            response = self._make_request(
+                f"/drives/{self.drive_id}/items/{file_item['id']}/content", headers=probe_headers, stream=True
+            )
+            download_url = response.url
         
-        print(f"[DOWNLOAD] Downloading {filename}...")
+        # Download beside the target and swap it in at the end, so a failed download
+        # never leaves a truncated file at destination_path
+        partial_path = destination_path.with_name(destination_path.name + ".part")
+        try:
+            if response.status_code == 416:
+                # Nothing to satisfy a range from: the file is empty
+                response.close()
+                partial_path.write_bytes(b"")
+            else:
+                response.raise_for_status()
+                total_size = _content_range_total(response) if response.status_code == 206 else None
+                if response.status_code == 206 and total_size is None:
+                    # A range answered without a total (bytes 0-0/*) holds just the probe's
+                    # byte, so fetch the whole file with a plain GET instead
+                    response.close()
+                    response = self._download_session.get(download_url, stream=True)
+                    response.raise_for_status()
+                if total_size is None:
+                    self._stream_download(response, partial_path, filename)
+                else:
+                    response.close()
+                    self._parallel_download(download_url, partial_path, total_size, filename)
+            
+            with open(partial_path, "r+b") as f:
+                os.fsync(f.fileno())
+            os.replace(partial_path, destination_path)
+        except BaseException:
+            response.close()
+            partial_path.unlink(missing_ok=True)
+            raise
         
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
+        if etag:
+            etag_path.write_text(etag)
+        elif etag_path.exists():
+            etag_path.unlink()
         
+        print(f"[OK] Saved to {destination_path}")
+        return destination_path
+    
+    def _stream_download(self, response: requests.Response, destination_path: Path, filename: str) -> None:
+        """Write a whole-file response to disk over its single connection."""
         total_size = int(response.headers.get("content-length", 0))
         downloaded = 0
+        last_print = 0
+        step = _progress_step(total_size)
         
+        # Read the raw stream in large blocks rather than iter_content's small chunks
+        response.raw.decode_content = True
         with open(destination_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            _preallocate(f, total_size)
+            while chunk := response.raw.read(DOWNLOAD_BUFFER_SIZE):
                 f.write(chunk)
                 downloaded += len(chunk)
-                if total_size:
-                    progress = (downloaded / total_size) * 100
-                    print(f"\r  Progress: {progress:.1f}%", end="", flush=True)
+                if total_size and (downloaded - last_print >= step or downloaded >= total_size):
+                    _print_progress(filename, downloaded, total_size)
+                    last_print = downloaded
+            # Drop any preallocated tail the body didn't fill
+            f.truncate()
+    
+    def _parallel_download(self, download_url: str, destination_path: Path, total_size: int, filename: str) -> None:
+        """Fetch the file as DOWNLOAD_SHARD_SIZE ranges over parallel connections."""
+        # Size the file up front so every shard can write straight to its own offset
+        with open(destination_path, "wb") as f:
+            f.truncate(total_size)
+            _preallocate(f, total_size)
         
-        print(f"\n[OK] Saved to {destination_path}")
-        return destination_path
+        shards = [
+            (start, min(start + DOWNLOAD_SHARD_SIZE, total_size) - 1)
+            for start in range(0, total_size, DOWNLOAD_SHARD_SIZE)
+        ]
+        downloaded = 0
+        last_print = 0
+        step = _progress_step(total_size)
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(shards))) as pool:
+            futures = [
+                pool.submit(self._download_range, download_url, destination_path, start, end)
+                for start, end in shards
+            ]
+            for future in as_completed(futures):
+                downloaded += future.result()
+                if downloaded - last_print >= step or downloaded >= total_size:
+                    _print_progress(filename, downloaded, total_size)
+                    last_print = downloaded
+    
+    def _download_range(self, download_url: str, destination_path: Path, start: int, end: int) -> int:
+        """Fetch bytes start..end (inclusive) into the same span of the file."""
+        # The pre-signed download URL needs no Authorization header
+        with self._download_session.get(download_url, headers={"Range": f"bytes={start}-{end}"}, stream=True) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise Exception(f"Server ignored the range request for bytes {start}-{end}")
+            
+            # Each shard has its own handle; seek + write also works where os.pwrite doesn't (Windows)
+            response.raw.decode_content = True
+            with open(destination_path, "r+b") as f:
+                f.seek(start)
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+                written = f.tell() - start
+        
+        # The file was pre-sized, so a shard cut short would otherwise leave zeros behind
+        if written != end - start + 1:
+            raise Exception(f"Got {written} of {end - start + 1} bytes for range {start}-{end}")
+        return written
+
+
+_downloader: Optional[SharePointDownloader] = None
+_downloader_lock = threading.Lock()
+
+
+def get_downloader() -> SharePointDownloader:
+    """
+    Shared, authenticated downloader, so repeated runs reuse its MSAL app and pooled connections.
+    
+    Authenticates on every call: after the first sign-in this is a silent token
+    lookup that also refreshes a token which expired since the last run.
+    """
+    global _downloader
+    with _downloader_lock:
+        if _downloader is None:
+            _downloader = SharePointDownloader()
+        _downloader.authenticate()
+        return _downloader
 
 
 def download_shipvoid_files(destination_dir: Path = Path(".")) -> tuple[Optional[Path], Optional[Path]]:
@@ -213,31 +560,38 @@ def download_shipvoid_files(destination_dir: Path = Path(".")) -> tuple[Optional
     print("="*60)
     print()
     
-    downloader = SharePointDownloader()
-    downloader.authenticate()
+    shipvoid_path = None
+    legacy_path = None
+    
+    downloader = get_downloader()
+    # Listings from an earlier run may predate newly uploaded files
+    downloader.clear_listing_cache()
     
     print(f"\nSearching for files in: {FOLDER_PATH}")
     
-    shipvoid_path = None
-    legacy_path = None
+    # Look both files up in a single round-trip
+    newest = downloader.batch_find_newest(FOLDER_PATH, [SHIPVOID_PATTERN, LEGACY_PATTERN])
     
-    # Find and download Shipvoid Forecast
-    print(f"\nLooking for: {SHIPVOID_PATTERN}")
-    shipvoid_file = downloader.find_newest_file(FOLDER_PATH, SHIPVOID_PATTERN)
-    if shipvoid_file:
-        print(f"  Found: {shipvoid_file['name']}")
-        shipvoid_path = downloader.download_file(shipvoid_file, destination_dir)
-    else:
-        print(f"  [WARN] No files matching '{SHIPVOID_PATTERN}' found")
-    
-    # Find and download Legacy Unbilled Cartons
-    print(f"\nLooking for: {LEGACY_PATTERN}")
-    legacy_file = downloader.find_newest_file(FOLDER_PATH, LEGACY_PATTERN)
-    if legacy_file:
-        print(f"  Found: {legacy_file['name']}")
-        legacy_path = downloader.download_file(legacy_file, destination_dir)
-    else:
-        print(f"  [WARN] No files matching '{LEGACY_PATTERN}' found")
+    # Report the Shipvoid Forecast and Legacy Unbilled Cartons lookups
+    for pattern in (SHIPVOID_PATTERN, LEGACY_PATTERN):
+        print(f"\nLooking for: {pattern}")
+        if newest[pattern]:
+            print(f"  Found: {newest[pattern]['name']}")
+        else:
+            print(f"  [WARN] No files matching '{pattern}' found")
+    
+    # The two files come from independent download URLs, so fetch them side by side
+    print()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            pattern: pool.submit(downloader.download_file, newest[pattern], destination_dir)
+            for pattern in (SHIPVOID_PATTERN, LEGACY_PATTERN)
+            if newest[pattern]
+        }
+    if SHIPVOID_PATTERN in futures:
+        shipvoid_path = futures[SHIPVOID_PATTERN].result()
+    if LEGACY_PATTERN in futures:
+        legacy_path = futures[LEGACY_PATTERN].result()
     
     print()
     print("="*60)
@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+import data_loader
+
+
+LEGACY_CSV = (
+    "container_id,container_create_date,event_ts_1,status_1,event_type_1,location_id_1\n"
+    "0123456,2024-01-02,2024-01-03 10:00:00,OPEN,PICK,A1\n"
+    "0000042,2024-01-02,2024-01-04 11:00:00,CLOSED,SHIP,B2\n"
+)
+
+
+def test_legacy_keeps_zero_padded_container_ids(tmp_path):
+    csv_path = tmp_path / "Legacy Unbilled Cartons.csv"
+    csv_path.write_text(LEGACY_CSV)
+
+    df = data_loader.load_legacy_unbilled(str(csv_path))
+
+    assert list(df['container_id']) == ['0123456', '0000042']
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+msal = pytest.importorskip("msal")
+pytest.importorskip("requests")
+
+import sharepoint_downloader
+
+
+class FakePersistedTokenCache(msal.SerializableTokenCache):
+    """Stands in for msal_extensions.PersistedTokenCache: saves itself but leaves has_state_changed set."""
+
+    def __init__(self, persistence):
+        super().__init__()
+        self.persistence = persistence
+
+    def modify(self, *args, **kwargs):
+        super().modify(*args, **kwargs)
+        self.has_state_changed = True
+
+
+class FakeMsalExtensions:
+    PersistedTokenCache = FakePersistedTokenCache
+
+    @staticmethod
+    def build_encrypted_persistence(location):
+        return location
+
+
+class FakeApp:
+    def __init__(self, client_id, authority, token_cache):
+        self.token_cache = token_cache
+
+    def get_accounts(self):
+        return []
+
+    def initiate_device_flow(self, scopes):
+        return {"user_code": "ABC", "message": "sign in"}
+
+    def acquire_token_by_device_flow(self, flow):
+        self.token_cache.has_state_changed = True
+        return {"access_token": "token"}
+
+
+def test_persisted_cache_never_writes_plaintext_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(sharepoint_downloader, "msal_extensions", FakeMsalExtensions)
+    monkeypatch.setattr(sharepoint_downloader.msal, "PublicClientApplication", FakeApp)
+
+    with sharepoint_downloader.SharePointDownloader() as downloader:
+        downloader.token_cache_file = tmp_path / "cache.json"
+        downloader.encrypted_token_cache_file = tmp_path / "cache.bin"
+
+        assert downloader.authenticate() == "token"
+        assert downloader.authenticate(force_refresh=True) == "token"
+
+    assert not downloader.token_cache_file.exists()
+    assert not downloader.token_cache_file.with_name("cache.json.tmp").exists()
+
+
+class FakeRangeResponse:
+    status_code = 206
+
+    def __init__(self, body):
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+
+def test_short_range_raises(tmp_path, monkeypatch):
+    destination = tmp_path / "file.bin"
+    destination.write_bytes(b"\0" * 8)
+
+    with sharepoint_downloader.SharePointDownloader() as downloader:
+        monkeypatch.setattr(downloader._download_session, "get", lambda *a, **kw: FakeRangeResponse(b"abc"))
+        with pytest.raises(Exception, match="Got 3 of 4 bytes"):
+            downloader._download_range("https://example.invalid/file", destination, 4, 7)
+
+        monkeypatch.setattr(downloader._download_session, "get", lambda *a, **kw: FakeRangeResponse(b"abcd"))
+        assert downloader._download_range("https://example.invalid/file", destination, 4, 7) == 4
+
+    assert destination.read_bytes() == b"\0" * 4 + b"abcd"
+
+
+class FakeResponse(FakeRangeResponse):
+    def __init__(self, body, status_code, headers):
+        super().__init__(body)
+        self.status_code = status_code
+        self.headers = headers
+        self.url = "https://example.invalid/file"
+
+    def close(self):
+        pass
+
+
+def test_unknown_range_total_refetches_whole_file(tmp_path, monkeypatch):
+    body = b"whole file contents"
+    requested = []
+
+    def fake_get(url, headers=None, stream=False):
+        requested.append(headers)
+        if headers and "Range" in headers:
+            return FakeResponse(body[:1], 206, {"content-range": "bytes 0-0/*"})
+        return FakeResponse(body, 200, {"content-length": str(len(body))})
+
+    with sharepoint_downloader.SharePointDownloader() as downloader:
+        monkeypatch.setattr(downloader._download_session, "get", fake_get)
+        file_item = {"name": "file.bin", "@microsoft.graph.downloadUrl": "https://example.invalid/file"}
+        path = downloader.download_file(file_item, tmp_path)
+
+    assert path.read_bytes() == body
+    assert requested == [{"Range": "bytes=0-0"}, None]